@@ -1,37 +1,161 @@
 """Green Works integration for Home Assistant."""
 
-from datetime import timedelta
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
-from typing import Final
-import io
-import contextlib
+from operator import attrgetter
+from typing import Any, Final
+import asyncio
+import time
+import zlib
+
+import aiohttp
 
 from homeassistant import config_entries, core
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from GreenWorksAPI.GreenWorksAPI import GreenWorksAPI, Mower, UnauthorizedException
-from .const import CONF_MOWER_NAME, DOMAIN
+from homeassistant.util import dt as dt_util
+from GreenWorksAPI.GreenWorksAPI import Mower, UnauthorizedException
+from GreenWorksAPI.Records import Login_object
+from .api import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
+    GreenWorksApiError,
+    GreenWorksClient,
+    RequestLimiter,
+)
+from .breaker import CircuitBreaker
+from .const import (
+    ACTIVE_MOWER_STATES,
+    BACKOFF_INITIAL,
+    BACKOFF_MAX,
+    BREAKER_THRESHOLD,
+    CONF_BACKFILL_STATISTICS,
+    CONF_CONNECT_TIMEOUT,
+    CONF_MOWER_NAME,
+    CONF_READ_TIMEOUT,
+    CONF_STALE_FAILURES,
+    CONF_STALE_MINUTES,
+    CONF_TOTAL_TIMEOUT,
+    DATA_ACCOUNT_LOCK,
+    DATA_ACCOUNTS,
+    DATA_FLOW_HANDOFF,
+    DATA_REQUEST_LIMITER,
+    DEFAULT_BACKFILL_STATISTICS,
+    DEFAULT_STALE_FAILURES,
+    DEFAULT_STALE_MINUTES,
+    DOCKED_MOWER_STATES,
+    DOMAIN,
+    FLOW_HANDOFF_TTL,
+    TOKEN_REFRESH_LEAD_TIME,
+    TOKEN_REFRESH_RETRY,
+    UPDATE_INTERVAL_ACTIVE,
+    UPDATE_INTERVAL_DEFAULT,
+    UPDATE_INTERVAL_DOCKED,
+    UPDATE_INTERVAL_OFFLINE,
+)
+from .models import MowerSnapshot
+from .session import MowingSessionTracker
+from .statistics import HourlyStatistics
+from .storage import (
+    GreenWorksSessionStore,
+    GreenWorksSnapshotStore,
+    GreenWorksStatisticsStore,
+    GreenWorksTokenStore,
+    async_get_session_store,
+    async_get_snapshot_store,
+    async_get_statistics_store,
+    async_get_token_store,
+)
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.warning("🚀 Greenworks integration is loading! (warning)")
 _LOGGER.debug("🐞 Debug logging is working in Greenworks.")
 
 PLATFORMS: Final = ["lawn_mower", "sensor", "binary_sensor"]
+# Snapshot fields entity listeners can watch for changes
+_NOTIFY_FIELDS: Final = (
+    "is_online",
+    "mower_main_state",
+    "battery_status",
+    "next_start",
+    "request_time",
+    "is_frost_sensor_on",
+    "is_rain_sensor_on",
+    "fetched_at",
+    "session",
+)
+# Fields that change on every poll without the mower changing
+_VOLATILE_FIELDS: Final = frozenset({"request_time", "fetched_at"})
+_mower_fingerprint = attrgetter(
+    "name", "sn", "model", *(field for field in _NOTIFY_FIELDS if field not in _VOLATILE_FIELDS)
+)
+
+
+@core.callback
+def async_get_request_limiter(hass: core.HomeAssistant) -> RequestLimiter:
+    """Return the limiter shared by every GreenWorks client of this instance."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    limiter: RequestLimiter | None = domain_data.get(DATA_REQUEST_LIMITER)
+    if limiter is None:
+        limiter = domain_data[DATA_REQUEST_LIMITER] = RequestLimiter()
+    return limiter
+
+
+@dataclass
+class FlowHandoff:
+    """Authenticated client and device fetch left behind by a finished config flow."""
+
+    api: GreenWorksClient
+    mowers: list[Mower]
+    expires: float
+
+
+@core.callback
+def async_store_flow_handoff(
+    hass: core.HomeAssistant, email: str, api: GreenWorksClient, mowers: list[Mower]
+) -> None:
+    """Offer the config flow's client and devices to the entry setup that follows it."""
+    handoffs: dict[str, FlowHandoff] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_FLOW_HANDOFF, {})
+    now = time.monotonic()
+    # Flows whose entry was never set up must not keep their clients alive
+    for stale in [key for key, handoff in handoffs.items() if handoff.expires < now]:
+        del handoffs[stale]
+    handoffs[email] = FlowHandoff(api, mowers, now + FLOW_HANDOFF_TTL.total_seconds())
+
+
+@core.callback
+def _async_pop_flow_handoff(hass: core.HomeAssistant, email: str) -> FlowHandoff | None:
+    handoff: FlowHandoff | None = hass.data[DOMAIN].get(DATA_FLOW_HANDOFF, {}).pop(email, None)
+    if handoff is None or handoff.expires < time.monotonic():
+        return None
+    return handoff
 
 async def async_setup_entry(hass: core.HomeAssistant, entry: config_entries.ConfigEntry) -> bool:
     """Set up Green Works from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    
-    try:
-        api = await hass.async_add_executor_job(GreenWorksAPI, entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD], hass.config.time_zone)
-    except UnauthorizedException as err:
-        raise ConfigEntryAuthFailed(err) from err
 
-    coordinator = GreenWorksDataCoordinator(hass, api, entry.data[CONF_MOWER_NAME])
-    hass.data[DOMAIN]["coordinator" + entry.data[CONF_MOWER_NAME]] = coordinator
+    coordinator = await _async_acquire_account_coordinator(hass, entry)
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    await coordinator.async_config_entry_first_refresh()
+    if (
+        CONF_MOWER_NAME in entry.data
+        and hass.is_running
+        and (account_entry := _loaded_account_entry(hass, entry)) is not None
+    ):
+        # A mower entry added at runtime takes over a mower the account entry
+        # serves until it is reloaded; its entities would otherwise clash with
+        # the unique ids added below. At startup the account entry already
+        # leaves out every mower with an entry of its own.
+        await hass.config_entries.async_reload(account_entry.entry_id)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -42,50 +166,641 @@ async def async_unload_entry(hass: core.HomeAssistant, entry: config_entries.Con
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop("coordinator" + entry.data[CONF_MOWER_NAME])
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_account_coordinator(hass, entry)
 
     return unload_ok
 
+
+async def _async_update_listener(hass: core.HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+    """Apply changed options to the account's client and coordinator."""
+    coordinator: GreenWorksDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if coordinator.async_update_credentials(entry.data[CONF_PASSWORD]):
+        await coordinator.async_request_refresh()
+    _async_apply_options(hass, coordinator)
+
+
+@core.callback
+def _loaded_account_entry(
+    hass: core.HomeAssistant, entry: config_entries.ConfigEntry
+) -> config_entries.ConfigEntry | None:
+    """Return the loaded entry serving all unclaimed mowers of the entry's account."""
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if (
+            other.data.get(CONF_EMAIL) == entry.data[CONF_EMAIL]
+            and CONF_MOWER_NAME not in other.data
+            and other.state is config_entries.ConfigEntryState.LOADED
+        ):
+            return other
+    return None
+
+
+@core.callback
+def async_get_options_entry(hass: core.HomeAssistant, email: str) -> config_entries.ConfigEntry | None:
+    """Return the entry whose options apply to the whole account.
+
+    Entries of an account share one client and coordinator, so only one set
+    of options can take effect: the account entry's, or the first mower
+    entry's when the account has none.
+    """
+    entries = [other for other in hass.config_entries.async_entries(DOMAIN) if other.data.get(CONF_EMAIL) == email]
+    return next((other for other in entries if CONF_MOWER_NAME not in other.data), entries[0] if entries else None)
+
+
+@core.callback
+def _async_apply_options(hass: core.HomeAssistant, coordinator: "GreenWorksDataCoordinator") -> None:
+    """Apply the account's options to its client and coordinator."""
+    entry = async_get_options_entry(hass, coordinator.email)
+    if entry is None:
+        return
+    coordinator.api.set_timeouts(*_timeouts(entry))
+    coordinator.set_stale_grace(*_stale_grace(entry))
+    coordinator.set_backfill_statistics(entry.options.get(CONF_BACKFILL_STATISTICS, DEFAULT_BACKFILL_STATISTICS))
+
+
+def _timeouts(entry: config_entries.ConfigEntry) -> tuple[float, float, float]:
+    """Return the connect, read and total timeouts configured for an entry."""
+    return (
+        entry.options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        entry.options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        entry.options.get(CONF_TOTAL_TIMEOUT, DEFAULT_TOTAL_TIMEOUT),
+    )
+
+
+def _stale_grace(entry: config_entries.ConfigEntry) -> tuple[int, timedelta]:
+    """Return how many failed polls, and for how long, an entry keeps serving stale data."""
+    return (
+        int(entry.options.get(CONF_STALE_FAILURES, DEFAULT_STALE_FAILURES)),
+        timedelta(minutes=entry.options.get(CONF_STALE_MINUTES, DEFAULT_STALE_MINUTES)),
+    )
+
+
+async def async_remove_config_entry_device(
+    hass: core.HomeAssistant, entry: config_entries.ConfigEntry, device_entry: dr.DeviceEntry
+) -> bool:
+    """Allow removing the device of a mower the account no longer reports."""
+    coordinator: GreenWorksDataCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is None:
+        return True
+    # Devices are identified like in GreenWorksValueEntity.device_info
+    reported = {mower.uid or name for name, mower in coordinator.mowers_by_name.items()}
+    return not any(
+        identifier[0] == DOMAIN and identifier[1] in reported for identifier in device_entry.identifiers
+    )
+
+
+async def async_remove_entry(hass: core.HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+    """Forget stored tokens and data once the last entry of an account is removed."""
+    email = entry.data[CONF_EMAIL]
+    if CONF_MOWER_NAME in entry.data and (account_entry := _loaded_account_entry(hass, entry)) is not None:
+        # Hand the mower back to the account entry
+        hass.async_create_task(hass.config_entries.async_reload(account_entry.entry_id))
+    if any(
+        other.data.get(CONF_EMAIL) == email
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        return
+    token_store = await async_get_token_store(hass)
+    token_store.async_remove(email)
+    snapshot_store = await async_get_snapshot_store(hass)
+    snapshot_store.async_remove(email)
+    session_store = await async_get_session_store(hass)
+    session_store.async_remove(email)
+    statistics_store = await async_get_statistics_store(hass)
+    statistics_store.async_remove(email)
+
+
+async def _async_acquire_account_coordinator(
+    hass: core.HomeAssistant, entry: config_entries.ConfigEntry
+) -> "GreenWorksDataCoordinator":
+    """Return the coordinator shared by all entries of the entry's account.
+
+    The first entry of an account creates the coordinator. Right after a config
+    flow it takes over the flow's logged-in client and fresh device fetch.
+    Otherwise, when the previous run left a snapshot, the data is hydrated from it and logging in plus the
+    first fetch are deferred until Home Assistant has started, keeping the
+    cloud off the boot path. Without a snapshot the entities cannot be
+    identified yet, so setup logs in (reusing stored tokens when there are any)
+    and waits for the initial fetch. Later entries for the same email
+    subscribe to the coordinator instead of logging in again.
+    """
+    email: str = entry.data[CONF_EMAIL]
+    accounts: dict[str, GreenWorksDataCoordinator] = hass.data[DOMAIN].setdefault(DATA_ACCOUNTS, {})
+    lock: asyncio.Lock = hass.data[DOMAIN].setdefault(DATA_ACCOUNT_LOCK, asyncio.Lock())
+
+    async with lock:
+        coordinator = accounts.get(email)
+        if coordinator is None:
+            handoff = _async_pop_flow_handoff(hass, email)
+            api = handoff.api if handoff is not None else GreenWorksClient(
+                async_get_clientsession(hass),
+                email,
+                entry.data[CONF_PASSWORD],
+                dt_util.get_time_zone(hass.config.time_zone) or dt_util.DEFAULT_TIME_ZONE,
+                limiter=async_get_request_limiter(hass),
+            )
+            token_store = await async_get_token_store(hass)
+            snapshot_store = await async_get_snapshot_store(hass)
+            session_store = await async_get_session_store(hass)
+            statistics_store = await async_get_statistics_store(hass)
+            coordinator = GreenWorksDataCoordinator(
+                hass, api, email, token_store, snapshot_store, session_store, statistics_store
+            )
+            _async_apply_options(hass, coordinator)
+
+            login_info = token_store.get(email)
+            if handoff is None and login_info is not None:
+                _LOGGER.debug("Reusing stored GreenWorks tokens for %s", email)
+                api.restore_login(login_info)
+
+            if handoff is not None:
+                _LOGGER.debug("Reusing the config flow's login and devices for %s", email)
+                coordinator.async_seed_data(handoff.mowers, fetched_at=dt_util.utcnow())
+                snapshot_store.async_set(email, handoff.mowers)
+            elif coordinator.async_restore_snapshot():
+                # Logs in on demand if there were no stored tokens
+                entry.async_create_background_task(
+                    hass, coordinator.async_refresh_when_started(), f"GreenWorks refresh {email}"
+                )
+            else:
+                try:
+                    if api.login_info is None:
+                        await api.async_login()
+                    await coordinator.async_refresh()
+                    if not coordinator.last_update_success:
+                        # The coordinator keeps the error instead of raising it
+                        raise coordinator.last_exception or UpdateFailed("GreenWorks returned no data")
+                except Exception as err:
+                    coordinator.async_cancel_token_refresh()
+                    if isinstance(err, (UnauthorizedException, ConfigEntryAuthFailed)):
+                        raise ConfigEntryAuthFailed(err) from err
+                    if isinstance(err, UpdateFailed):
+                        raise ConfigEntryNotReady(str(err)) from err
+                    if isinstance(err, (aiohttp.ClientError, asyncio.TimeoutError, GreenWorksApiError)):
+                        raise ConfigEntryNotReady(f"Could not log in to GreenWorks: {err}") from err
+                    raise
+            coordinator.async_schedule_token_refresh()
+            accounts[email] = coordinator
+        else:
+            # A reauth reloads only its own entry; the other entries of the
+            # account share this client and must not keep the old credentials
+            handoff = _async_pop_flow_handoff(hass, email)
+            if coordinator.async_update_credentials(
+                entry.data[CONF_PASSWORD], handoff.api.login_info if handoff is not None else None
+            ):
+                entry.async_create_background_task(
+                    hass, coordinator.async_request_refresh(), f"GreenWorks refresh {email}"
+                )
+            # An account entry added after mower entries takes over the options
+            _async_apply_options(hass, coordinator)
+
+        coordinator.entry_ids.add(entry.entry_id)
+    return coordinator
+
+
+async def _async_release_account_coordinator(hass: core.HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+    """Drop the entry's subscription and shut the account down once unused."""
+    email: str = entry.data[CONF_EMAIL]
+    accounts: dict[str, GreenWorksDataCoordinator] = hass.data[DOMAIN].get(DATA_ACCOUNTS, {})
+    coordinator = accounts.get(email)
+    if coordinator is None:
+        return
+    coordinator.entry_ids.discard(entry.entry_id)
+    if not coordinator.entry_ids:
+        accounts.pop(email)
+        coordinator.async_cancel_token_refresh()
+        coordinator.api.cancel()
+        # Not tied to a config entry, so Home Assistant leaves this to us
+        await coordinator.async_shutdown()
+
+
 class GreenWorksDataCoordinator(DataUpdateCoordinator):
     """Get and update the latest data."""
 
-    def __init__(self, hass: core.HomeAssistant, api: GreenWorksAPI, mower_name) -> None:
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        api: GreenWorksClient,
+        email: str,
+        token_store: GreenWorksTokenStore,
+        snapshot_store: GreenWorksSnapshotStore,
+        session_store: GreenWorksSessionStore,
+        statistics_store: GreenWorksStatisticsStore,
+    ) -> None:
         """Initialize the GreenWorksDataCoordinator."""
         super().__init__(
             hass,
             _LOGGER,
-            name="GreenWorksData",
-            update_interval=timedelta(seconds=60),
+            # Shared by every entry of the account, so no single entry owns it:
+            # entries release it on unload and auth failures reauth all of them
+            config_entry=None,
+            name=f"GreenWorksData {email}",
+            update_interval=UPDATE_INTERVAL_DEFAULT,
         )
         self.api = api
-        self.mower_name = mower_name
+        self.email = email
+        # Config entries (one per mower) currently subscribed to this account
+        self.entry_ids: set[str] = set()
         self._mower:list[Mower]
+        # Lookup table rebuilt once per refresh so entities resolve their mower in O(1)
+        self.mowers_by_name: dict[str, MowerSnapshot] = {}
+        # Entity values per mower and description key, evaluated in one pass
+        # per refresh from the descriptions the platforms register
+        self._value_fns: dict[str, Callable[[MowerSnapshot], Any]] = {}
+        self.values: dict[str, dict[str, Any]] = {}
+        # Per-mower field values the listeners were last notified about
+        self._notified_fields: dict[str, dict[str, Any]] = {}
+        self._notified_success: bool | None = None
+        # Non-volatile content of the current and the last notified snapshots
+        self._fingerprint: tuple[Any, ...] = ()
+        self._notified_fingerprint: tuple[Any, ...] | None = None
+        self.skipped_notifications = 0
+        self._token_store = token_store
+        self._snapshot_store = snapshot_store
+        self._session_store = session_store
+        # Mowing session statistics per mower name, advanced on every live fetch
+        self.sessions: dict[str, MowingSessionTracker] = session_store.get(email)
+        # Hourly long-term statistics, resuming samples persisted before a restart
+        self._statistics_store = statistics_store
+        self.statistics = HourlyStatistics(hass, statistics_store.get(email))
+        self.backfill_statistics = DEFAULT_BACKFILL_STATISTICS
+        self.breaker = CircuitBreaker(
+            BREAKER_THRESHOLD, BACKOFF_INITIAL.total_seconds(), BACKOFF_MAX.total_seconds()
+        )
+        # Time of the last successful fetch, and whether the data is older than
+        # the last poll because later polls failed within the stale grace
+        self.last_success: datetime | None = None
+        self.stale = False
+        self._stale_max_failures = DEFAULT_STALE_FAILURES
+        self._stale_max_age = timedelta(minutes=DEFAULT_STALE_MINUTES)
+        # Fixed position of this account's polls within every poll interval, so
+        # accounts spread their polls instead of firing together after a restart
+        self.poll_phase = zlib.crc32(email.lower().encode()) / 2**32
+        self._unsub_token_refresh: core.CALLBACK_TYPE | None = None
+        api.on_login_changed = self._handle_login_changed
 
     @property
     def mower(self) -> list[Mower]:
         """Return the mower data."""
         return self.data if self.data else []
 
+    def get_mower(self, name: str) -> MowerSnapshot | None:
+        """Return the mower with the given name from the latest data."""
+        return self.mowers_by_name.get(name)
+
+    def get_value(self, name: str, key: str) -> Any:
+        """Return the value of a registered description for a mower."""
+        return self.values.get(name, {}).get(key)
+
+    @core.callback
+    def async_register_values(self, descriptions: Iterable[Any]) -> None:
+        """Evaluate the ``value_fn`` of these entity descriptions on every refresh."""
+        for description in descriptions:
+            self._value_fns[description.key] = description.value_fn
+        self._evaluate_values()
+
+    @core.callback
+    def async_restore_snapshot(self) -> bool:
+        """Seed the data with the mowers persisted by the previous run.
+
+        Returns False when there is nothing to restore.
+        """
+        mowers = self._snapshot_store.get(self.email)
+        if not mowers:
+            return False
+        _LOGGER.debug("Restored %d mowers for %s from the stored snapshot", len(mowers), self.email)
+        self.async_seed_data(mowers)
+        return True
+
+    @core.callback
+    def set_backfill_statistics(self, backfill: bool) -> None:
+        """Set whether statistics samples not imported yet survive a restart."""
+        self.backfill_statistics = backfill
+        if not backfill:
+            self._statistics_store.async_remove(self.email)
+
+    @core.callback
+    def set_stale_grace(self, max_failures: int, max_age: timedelta) -> None:
+        """Set how long failed polls keep serving the last fetched data."""
+        self._stale_max_failures = max_failures
+        self._stale_max_age = max_age
+
+    @core.callback
+    def async_seed_data(self, mowers: list[Mower], fetched_at: datetime | None = None) -> None:
+        """Use already fetched mowers as data without notifying listeners.
+
+        ``fetched_at`` is the time of a live fetch; restored snapshots leave it
+        unset so they are not served as stale data once polling fails.
+        """
+        self.last_success = fetched_at
+        self._mower = mowers
+        self._index_mowers(mowers, fetched_at)
+        self.update_interval = self._staggered(self._next_update_interval(self.mowers_by_name.values()))
+        self.data = mowers
+
+    async def async_refresh_when_started(self) -> None:
+        """Refresh once Home Assistant has finished starting."""
+        started = asyncio.Event()
+
+        @core.callback
+        def _async_started(_hass: core.HomeAssistant) -> None:
+            started.set()
+
+        cancel = async_at_started(self.hass, _async_started)
+        try:
+            await started.wait()
+        finally:
+            cancel()
+        # Spread the first refreshes of all accounts over one default interval
+        await asyncio.sleep(self.poll_phase * UPDATE_INTERVAL_DEFAULT.total_seconds())
+        await self.async_refresh()
+
+    def _index_mowers(self, mowers: list[Mower], fetched_at: datetime | None = None) -> None:
+        sessions_changed = False
+        hour_completed = False
+        snapshots = []
+        for mower in mowers:
+            if mower.name is None:
+                continue
+            tracker = self.sessions.get(mower.name)
+            if fetched_at is None:
+                stats = tracker.roll_to(dt_util.now().date()) if tracker is not None else None
+                snapshots.append(MowerSnapshot.from_mower(mower, None, stats))
+                continue
+            if tracker is None:
+                tracker = self.sessions[mower.name] = MowingSessionTracker()
+            previous = tracker.stats
+            state = getattr(mower.operating_status, "mower_main_state", None)
+            stats = tracker.update(getattr(state, "name", None), dt_util.as_local(fetched_at))
+            sessions_changed |= stats != previous
+            snapshot = MowerSnapshot.from_mower(mower, fetched_at, stats)
+            snapshots.append(snapshot)
+            hour_completed |= self.statistics.add(
+                snapshot.uid or snapshot.name, snapshot.name, tracker.minutes_added, fetched_at
+            )
+        if sessions_changed:
+            self._session_store.async_set(self.email, self.sessions)
+        if fetched_at is not None and self.backfill_statistics:
+            self._statistics_store.async_set(self.email, self.statistics.as_dict())
+        if hour_completed and (entry := self._subscribed_entry()) is not None:
+            # Bound to an entry so the import does not outlive an unload
+            entry.async_create_background_task(
+                self.hass, self.statistics.async_import(), f"GreenWorks statistics {self.email}"
+            )
+        self.mowers_by_name = {s.name: s for s in snapshots}
+        self._fingerprint = tuple(map(_mower_fingerprint, snapshots))
+        self._evaluate_values()
+
+    def _subscribed_entry(self) -> config_entries.ConfigEntry | None:
+        for entry_id in self.entry_ids:
+            if (entry := self.hass.config_entries.async_get_entry(entry_id)) is not None:
+                return entry
+        return None
+
+    def _evaluate_values(self) -> None:
+        value_fns = self._value_fns.items()
+        self.values = {
+            name: {key: value_fn(mower) for key, value_fn in value_fns}
+            for name, mower in self.mowers_by_name.items()
+        }
+
+    @core.callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose mower fields changed since the last notification.
+
+        Entities subscribe with a ``(mower_name, fields)`` context; listeners
+        without such a context, and every listener when availability of the
+        whole coordinator flips, are always called. When nothing but volatile
+        fields changed and no listener watches those, the per-mower diff is
+        skipped and only the listeners without such a context are called.
+        """
+        if (
+            self._fingerprint == self._notified_fingerprint
+            and self.last_update_success == self._notified_success
+            and not self._has_volatile_watchers()
+        ):
+            self.skipped_notifications += 1
+            for update_callback, context in list(self._listeners.values()):
+                if not isinstance(context, tuple):
+                    update_callback()
+            return
+        self._notified_fingerprint = self._fingerprint
+
+        fields = {name: _mower_fields(mower) for name, mower in self.mowers_by_name.items()}
+        notify_all = self.last_update_success != self._notified_success
+        changed: dict[str, set[str]] = {}
+        if not notify_all:
+            for name in fields.keys() | self._notified_fields.keys():
+                old, new = self._notified_fields.get(name), fields.get(name)
+                if old is None or new is None:
+                    changed[name] = set((old or new or {}).keys())
+                else:
+                    diff = {key for key, value in new.items() if old.get(key) != value}
+                    if diff:
+                        changed[name] = diff
+        self._notified_fields = fields
+        self._notified_success = self.last_update_success
+
+        for update_callback, context in list(self._listeners.values()):
+            if notify_all or not isinstance(context, tuple):
+                update_callback()
+                continue
+            mower_name, watched = context
+            if mower_name in changed and not changed[mower_name].isdisjoint(watched):
+                update_callback()
+
+    def _has_volatile_watchers(self) -> bool:
+        return any(
+            isinstance(context, tuple) and not _VOLATILE_FIELDS.isdisjoint(context[1])
+            for _, context in self._listeners.values()
+        )
+
     async def _async_update_data(self):
-        """Fetch data from API endpoint."""
+        """Fetch data from API endpoint, serving the last data through short outages.
+
+        While the consecutive failures and the age of the data stay within the
+        configured grace, a failed poll returns the previous data unchanged, so
+        entities neither flap to unavailable nor write identical states.
+        """
+        try:
+            mowers = await self._async_poll()
+        except UpdateFailed as err:
+            if not self._within_stale_grace():
+                self.stale = False
+                raise
+            if not self.stale:
+                _LOGGER.warning(
+                    "GreenWorks poll for %s failed (%s); keeping data from %s",
+                    self.email, err, self.last_success,
+                )
+            self.stale = True
+            return self.data
+        if self.stale:
+            _LOGGER.info("GreenWorks polling for %s recovered", self.email)
+        self.stale = False
+        return mowers
+
+    def _within_stale_grace(self) -> bool:
+        if self.data is None or self.last_success is None:
+            return False
+        return (
+            self.breaker.failures <= self._stale_max_failures
+            and dt_util.utcnow() - self.last_success <= self._stale_max_age
+        )
+
+    async def _async_poll(self) -> list[Mower]:
+        """Fetch the mowers unless the circuit breaker holds polls back."""
+        if not self.breaker.allow_request():
+            retry_in = self.breaker.retry_in()
+            self.update_interval = timedelta(seconds=retry_in)
+            raise UpdateFailed(f"GreenWorks cloud is failing; next attempt in {retry_in:.0f} s")
+
+        try:
+            mowers = await self._async_fetch_mowers()
+        except UpdateFailed:
+            delay = self.breaker.record_failure()
+            self.update_interval = timedelta(seconds=delay)
+            _LOGGER.debug(
+                "GreenWorks poll for %s failed %d time(s); circuit %s, retrying in %.0f s",
+                self.email, self.breaker.failures, self.breaker.state.value, delay,
+            )
+            raise
+
+        self.breaker.record_success()
+        self.last_success = dt_util.utcnow()
+        self._mower = mowers
+        self._index_mowers(mowers, self.last_success)
+        self.update_interval = self._staggered(self._next_update_interval(self.mowers_by_name.values()))
+        self._snapshot_store.async_set(self.email, mowers)
+        return mowers
+
+    async def _async_fetch_mowers(self) -> list[Mower]:
+        """Fetch the account's mowers, translating errors for the coordinator."""
         try:
             _LOGGER.debug("Fetching data from GreenWorks API")
-            # Capture stdout from the third-party library (which uses print) so it appears in HA logs
-            def _call_with_captured_stdout():
-                buf = io.StringIO()
-                with contextlib.redirect_stdout(buf):
-                    result = self.api.get_devices()
-                out = buf.getvalue()
-                if out:
-                    _LOGGER.debug("GreenWorksAPI stdout (get_devices):\n%s", out.strip())
-                return result
-
-            self._mower = await self.hass.async_add_executor_job(_call_with_captured_stdout)
-            _LOGGER.debug("Fetched %d mowers: %s", len(self._mower), [m.name for m in self._mower])
-            return self._mower
+            mowers = await self.api.async_get_devices()
+            _LOGGER.debug("Fetched %d mowers: %s", len(mowers), [m.name for m in mowers])
+            return mowers
+        except UnauthorizedException as ex:
+            self._async_start_reauth()
+            raise ConfigEntryAuthFailed(ex) from ex
+        except TimeoutError as ex:
+            _LOGGER.error("Timed out calling GreenWorks API")
+            raise UpdateFailed("Timed out calling GreenWorks") from ex
         except KeyError as ex:
             _LOGGER.error("KeyError calling GreenWorks API: %s", ex)
             raise UpdateFailed("Problems calling GreenWorks") from ex
         except Exception as ex:
             _LOGGER.error("Unexpected error calling GreenWorks API: %s", ex)
-            raise UpdateFailed("Problems calling GreenWorks") from ex
\ No newline at end of file
+            raise UpdateFailed("Problems calling GreenWorks") from ex
+
+    @core.callback
+    def _async_start_reauth(self) -> None:
+        """Ask every entry of the account for new credentials; they share one login."""
+        for entry_id in self.entry_ids:
+            if (entry := self.hass.config_entries.async_get_entry(entry_id)) is not None:
+                entry.async_start_reauth(self.hass)
+
+    @core.callback
+    def _handle_login_changed(self, login_info: Login_object) -> None:
+        """Persist new tokens and plan their refresh."""
+        self._token_store.async_set(self.email, login_info)
+        self.async_schedule_token_refresh()
+
+    @core.callback
+    def async_update_credentials(self, password: str, login_info: Login_object | None = None) -> bool:
+        """Give the shared client the password of a reauthenticated entry.
+
+        Return whether anything changed, in which case the caller should
+        request a refresh.
+        """
+        if not self.api.set_credentials(password, login_info):
+            return False
+        _LOGGER.debug("Credentials of %s changed", self.email)
+        if login_info is None:
+            # Tokens of the old password are useless; the next poll logs in again
+            self.async_cancel_token_refresh()
+            self._token_store.async_remove(self.email)
+        return True
+
+    @core.callback
+    def async_schedule_token_refresh(self, delay: float | None = None) -> None:
+        """Refresh the access token in the background shortly before it expires."""
+        self.async_cancel_token_refresh()
+        login_info = self.api.login_info
+        if delay is None:
+            if login_info is None or login_info.expire_in <= time.time():
+                # Already expired: the next request refreshes it on demand
+                return
+            # Ahead of the on-demand refresh polls make once expire_in has passed
+            delay = max(login_info.expire_in - time.time() - TOKEN_REFRESH_LEAD_TIME.total_seconds(), 0)
+        self._unsub_token_refresh = async_call_later(self.hass, delay, self._handle_token_refresh)
+
+    @core.callback
+    def async_cancel_token_refresh(self) -> None:
+        """Stop the planned token refresh."""
+        if self._unsub_token_refresh is not None:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+
+    @core.callback
+    def _handle_token_refresh(self, _now: datetime) -> None:
+        self._unsub_token_refresh = None
+        self.hass.async_create_background_task(
+            self._async_refresh_token(), f"GreenWorks token refresh {self.email}"
+        )
+
+    async def _async_refresh_token(self) -> None:
+        try:
+            # On success the client reports the new tokens, which reschedules us
+            await self.api.async_refresh_access_token()
+        except UnauthorizedException as ex:
+            # The next poll raises ConfigEntryAuthFailed and starts reauth
+            _LOGGER.warning("GreenWorks rejected the stored credentials for %s: %s", self.email, ex)
+        except Exception as ex:
+            _LOGGER.warning("Could not refresh GreenWorks token for %s: %s", self.email, ex)
+            self.async_schedule_token_refresh(TOKEN_REFRESH_RETRY.total_seconds())
+
+    def _staggered(self, interval: timedelta) -> timedelta:
+        """Adjust an interval so the next poll lands on this account's phase.
+
+        Polls happen at wall-clock multiples of the interval shifted by the
+        account's phase. The adjusted interval lies between a quarter and one
+        and a quarter of the requested one, and equals it once aligned.
+        """
+        period = interval.total_seconds()
+        delay = (self.poll_phase * period - time.time()) % period
+        if delay < period / 4:
+            delay += period
+        return timedelta(seconds=delay)
+
+    @staticmethod
+    def _next_update_interval(mowers: Iterable[MowerSnapshot]) -> timedelta:
+        """Pick the poll interval for the most active mower of the account.
+
+        Mowers that are moving are polled fast, docked mowers slowly unless a
+        scheduled start is due before the next slow poll, and offline mowers
+        very slowly.
+        """
+        now = dt_util.now()
+        return min((_mower_update_interval(mower, now) for mower in mowers), default=UPDATE_INTERVAL_DEFAULT)
+
+
+def _mower_fields(mower: MowerSnapshot) -> dict[str, Any]:
+    """Return the values entities derive their state from."""
+    return {field: getattr(mower, field) for field in _NOTIFY_FIELDS}
+
+
+def _mower_update_interval(mower: MowerSnapshot, now: datetime) -> timedelta:
+    if not mower.is_online:
+        return UPDATE_INTERVAL_OFFLINE
+    state_name = getattr(mower.mower_main_state, "name", None)
+    if state_name in ACTIVE_MOWER_STATES:
+        return UPDATE_INTERVAL_ACTIVE
+    if state_name in DOCKED_MOWER_STATES:
+        next_start = mower.next_start
+        if next_start is not None and now <= next_start <= now + UPDATE_INTERVAL_DOCKED:
+            return UPDATE_INTERVAL_DEFAULT
+        return UPDATE_INTERVAL_DOCKED
+    return UPDATE_INTERVAL_DEFAULT
@@ -0,0 +1,410 @@
+"""Asyncio client for the GreenWorks cloud, built on Home Assistant's shared aiohttp session."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, tzinfo
+import json
+import logging
+import os
+import time
+from typing import Any, Callable
+
+import aiohttp
+
+from GreenWorksAPI.Enums import MowerState
+from GreenWorksAPI.GreenWorksAPI import Mower, UnauthorizedException
+from GreenWorksAPI.Records import Login_object, Mower_operating_status, Mower_properties
+
+_LOGGER = logging.getLogger(__name__)
+
+# Overridable to point the integration at scripts/simulator.py
+BASE_URL = os.environ.get("GREENWORKS_API_BASE_URL", "https://xapi.globetools.systems/v2/")
+CORP_ID = "100fa2b00b622800"
+# Error code returned with HTTP 403 when the access token is no longer accepted
+TOKEN_REJECTED_CODE = 4031022
+# Refresh the access token this many seconds before the cloud expires it
+TOKEN_EXPIRY_MARGIN = 300
+# Default timeouts in seconds: connecting, waiting for data on a socket, and a
+# whole login or device fetch including every request it makes
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 10.0
+DEFAULT_TOTAL_TIMEOUT = 45.0
+# Requests in flight across all accounts, and the least deadline for one
+# request including the time spent waiting for a slot (clients with longer
+# socket timeouts get a longer one)
+MAX_CONCURRENT_REQUESTS = 10
+REQUEST_DEADLINE = 30
+
+
+class GreenWorksApiError(Exception):
+    """Raised when the GreenWorks cloud returns an unusable response."""
+
+
+class RequestLimiter:
+    """Bound the GreenWorks requests in flight and keep queue statistics.
+
+    Shared by every client so a hanging cloud ties up at most
+    ``max_concurrent`` connections, however many accounts are configured.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS, deadline: float = REQUEST_DEADLINE) -> None:
+        """Initialize the limiter."""
+        self.max_concurrent = max_concurrent
+        self.deadline = deadline
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.requests = 0
+        self.deadline_exceeded = 0
+
+    @asynccontextmanager
+    async def slot(self, deadline: float | None = None) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it, all within the per-call deadline.
+
+        ``deadline`` overrides the limiter's default for this call.
+        """
+        try:
+            async with asyncio.timeout(deadline or self.deadline) as deadline_cm:
+                self.queued += 1
+                self.max_queued = max(self.max_queued, self.queued)
+                try:
+                    await self._semaphore.acquire()
+                finally:
+                    self.queued -= 1
+                self.in_flight += 1
+                self.requests += 1
+                try:
+                    yield
+                finally:
+                    self.in_flight -= 1
+                    self._semaphore.release()
+        except TimeoutError:
+            # Socket timeouts inside the slot are the client's to count
+            if deadline_cm.expired():
+                self.deadline_exceeded += 1
+            raise
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current statistics."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "deadline": self.deadline,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "requests": self.requests,
+            "deadline_exceeded": self.deadline_exceeded,
+        }
+
+
+class GreenWorksClient:
+    """Speak the GreenWorks cloud endpoints without blocking the event loop.
+
+    Mirrors the endpoints used by ``GreenWorksAPI.GreenWorksAPI`` and returns the
+    same ``Mower`` records, but every request goes through the passed aiohttp
+    session so connections are pooled across polls and accounts.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        email: str,
+        password: str,
+        timezone: tzinfo,
+        base_url: str = BASE_URL,
+        limiter: RequestLimiter | None = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        total_timeout: float = DEFAULT_TOTAL_TIMEOUT,
+    ) -> None:
+        """Initialize the client; call ``async_login`` before fetching data."""
+        self._session = session
+        self._email = email
+        self._password = password
+        self._timezone = timezone
+        self._base_url = base_url
+        self._limiter = limiter or RequestLimiter()
+        self._auth_lock = asyncio.Lock()
+        self.login_info: Login_object | None = None
+        # Called with the new login info whenever the tokens change
+        self.on_login_changed: Callable[[Login_object], None] | None = None
+        self._devices_task: asyncio.Task[list[Mower]] | None = None
+        self.set_timeouts(connect_timeout, read_timeout, total_timeout)
+        self.stats: dict[str, int] = {
+            "fetches": 0,
+            "fetch_timeouts": 0,
+            "login_timeouts": 0,
+            "request_timeouts": 0,
+        }
+
+    def set_timeouts(self, connect_timeout: float, read_timeout: float, total_timeout: float) -> None:
+        """Change the timeouts used from the next request on."""
+        self._request_timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self._total_timeout = total_timeout
+        # The shared limiter must not cut a request off before its socket timeouts
+        self._request_deadline = max(REQUEST_DEADLINE, connect_timeout + read_timeout)
+
+    @asynccontextmanager
+    async def _deadline(self, operation: str) -> AsyncIterator[None]:
+        """Bound a whole operation by the total timeout, cancelling what it still awaits."""
+        deadline = asyncio.timeout(self._total_timeout)
+        try:
+            async with deadline:
+                yield
+        except TimeoutError:
+            # Socket timeouts of single requests are counted where they happen
+            if deadline.expired():
+                self.stats[f"{operation}_timeouts"] += 1
+                _LOGGER.debug("GreenWorks %s for %s timed out after %s s", operation, self._email, self._total_timeout)
+            raise
+
+    def cancel(self) -> None:
+        """Cancel the device fetch in flight, e.g. when the account is unloaded."""
+        if self._devices_task is not None:
+            self._devices_task.cancel()
+
+    def restore_login(self, login_info: Login_object) -> None:
+        """Reuse tokens from an earlier session instead of logging in with the password."""
+        self.login_info = login_info
+
+    def set_credentials(self, password: str, login_info: Login_object | None = None) -> bool:
+        """Replace the password after reauth; return whether the client changed.
+
+        Tokens of the old password are dropped so the next request logs in
+        again, unless ``login_info`` of a login with the new password is passed.
+        """
+        if password == self._password and login_info is None:
+            return False
+        self._password = password
+        if login_info is not None:
+            self._set_login_info(login_info)
+        else:
+            self.login_info = None
+        return True
+
+    def _set_login_info(self, login_info: Login_object) -> None:
+        self.login_info = login_info
+        if self.on_login_changed is not None:
+            self.on_login_changed(login_info)
+
+    async def async_login(self) -> None:
+        """Log in with email and password and store the returned tokens."""
+        async with self._deadline("login"):
+            await self._async_login()
+
+    async def _async_login(self) -> None:
+        _LOGGER.debug("Logging in to GreenWorks as %s", self._email)
+        body = {"corp_id": CORP_ID, "email": self._email, "password": self._password}
+        async with self._limiter.slot(self._request_deadline), self._session.post(
+            f"{self._base_url}user_auth", json=body, timeout=self._request_timeout
+        ) as response:
+            if response.status in (400, 401, 403):
+                raise UnauthorizedException(f"Login rejected with status {response.status}")
+            response.raise_for_status()
+            data: dict[str, Any] = await response.json(content_type=None)
+
+        if "user_id" not in data or "access_token" not in data:
+            raise UnauthorizedException("Login response is missing user_id or access_token")
+        self._set_login_info(Login_object(
+            access_token=data["access_token"],
+            refresh_token=data.get("refresh_token", ""),
+            user_id=data["user_id"],
+            expire_in=_expiry(data),
+            authorize=data.get("authorize", ""),
+        ))
+
+    async def async_refresh_access_token(self) -> None:
+        """Exchange the refresh token for a new access token ahead of its expiry."""
+        login_info = self.login_info
+        async with self._deadline("login"), self._auth_lock:
+            if self.login_info is not login_info:
+                # A request refreshed the tokens while we waited; the refresh
+                # token we would spend is already used up
+                return
+            await self._async_refresh_access_token()
+
+    async def _async_refresh_access_token(self) -> None:
+        """Refresh the access token, logging in again when the refresh is refused."""
+        if self.login_info is None:
+            await self._async_login()
+            return
+        _LOGGER.debug("Refreshing GreenWorks access token for %s", self._email)
+        async with self._limiter.slot(self._request_deadline), self._session.post(
+            f"{self._base_url}user/token/refresh",
+            json={"refresh_token": self.login_info.refresh_token},
+            headers={"Access-Token": self.login_info.access_token},
+            timeout=self._request_timeout,
+        ) as response:
+            if response.status != 200:
+                _LOGGER.debug("Token refresh failed with status %s; logging in again", response.status)
+                data = None
+            else:
+                data = await response.json(content_type=None)
+
+        if not data or "access_token" not in data:
+            await self._async_login()
+            return
+        self._set_login_info(Login_object(
+            access_token=data["access_token"],
+            refresh_token=data.get("refresh_token", self.login_info.refresh_token),
+            user_id=self.login_info.user_id,
+            expire_in=_expiry(data),
+            authorize=self.login_info.authorize,
+        ))
+
+    async def _async_ensure_token(self) -> Login_object:
+        """Return valid login info, refreshing it first when it is about to expire."""
+        async with self._auth_lock:
+            if self.login_info is None:
+                await self._async_login()
+            elif time.time() > self.login_info.expire_in:
+                await self._async_refresh_access_token()
+            assert self.login_info is not None
+            return self.login_info
+
+    async def _async_relogin(self, rejected: Login_object) -> Login_object:
+        """Log in again unless a concurrent request already replaced the rejected token."""
+        async with self._auth_lock:
+            if self.login_info is rejected or self.login_info is None:
+                await self._async_login()
+            assert self.login_info is not None
+            return self.login_info
+
+    async def _async_get(self, endpoint: str, params: dict[str, str] | None = None) -> Any:
+        """GET an endpoint and return its decoded JSON body."""
+        try:
+            return await self._async_get_with_relogin(endpoint, params)
+        except TimeoutError:
+            self.stats["request_timeouts"] += 1
+            raise
+
+    async def _async_get_with_relogin(self, endpoint: str, params: dict[str, str] | None) -> Any:
+        login_info = await self._async_ensure_token()
+        for attempt in range(2):
+            started = time.monotonic()
+            rejected = False
+            async with self._limiter.slot(self._request_deadline), self._session.get(
+                f"{self._base_url}{endpoint}",
+                params=params,
+                headers={"Content-Type": "application/json", "Access-Token": login_info.access_token},
+                timeout=self._request_timeout,
+            ) as response:
+                if response.status == 403 and attempt == 0:
+                    try:
+                        error = await response.json(content_type=None)
+                    except ValueError:
+                        error = None
+                    if _error_code(error) == TOKEN_REJECTED_CODE:
+                        _LOGGER.debug("Access token rejected for %s; logging in again", endpoint)
+                        rejected = True
+                if not rejected:
+                    if response.status >= 400:
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("GET %s failed: status=%s body=%s", endpoint, response.status, (await response.text())[:500])
+                        raise GreenWorksApiError(f"GET {endpoint} failed with status {response.status}")
+                    data = await response.json(content_type=None)
+                    _LOGGER.debug("GET %s status=%s in %.0f ms", endpoint, response.status, (time.monotonic() - started) * 1000)
+                    return data
+            # Log in again after giving up the request slot, which the login needs
+            login_info = await self._async_relogin(login_info)
+        raise GreenWorksApiError(f"GET {endpoint} was rejected after logging in again")
+
+    async def async_get_devices(self) -> list[Mower]:
+        """Return every mower subscribed to the account with properties and status.
+
+        Concurrent callers join the fetch already in flight instead of starting
+        their own, and cancelling one caller does not cancel it for the others.
+        """
+        if self._devices_task is None:
+            task = asyncio.get_running_loop().create_task(self._async_fetch_devices())
+            task.add_done_callback(self._devices_task_done)
+            self._devices_task = task
+        return await asyncio.shield(self._devices_task)
+
+    def _devices_task_done(self, task: asyncio.Task[list[Mower]]) -> None:
+        if self._devices_task is task:
+            self._devices_task = None
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _async_fetch_devices(self) -> list[Mower]:
+        self.stats["fetches"] += 1
+        async with self._deadline("fetch"):
+            return await self._async_fetch_devices_unbounded()
+
+    async def _async_fetch_devices_unbounded(self) -> list[Mower]:
+        login_info = await self._async_ensure_token()
+        data = await self._async_get(f"user/{login_info.user_id}/subscribe/devices", {"version": "0"})
+        devices = data.get("list") if isinstance(data, dict) else None
+        if not isinstance(devices, list):
+            raise GreenWorksApiError("Device list response does not contain a 'list' of devices")
+
+        # Per-device requests are independent, so run them concurrently.
+        return list(await asyncio.gather(*(self._async_get_mower(device) for device in devices)))
+
+    async def _async_get_mower(self, device: dict[str, Any]) -> Mower:
+        product_id = device.get("product_id")
+        device_id = device.get("id")
+        properties, status = await asyncio.gather(
+            self._async_get(f"product/{product_id}/device/{device_id}/property"),
+            self._async_get(f"product/{product_id}/v_device/{device_id}", {"datapoints": "32"}),
+        )
+        return Mower(
+            id=device_id,
+            name=device.get("name"),
+            sn=device.get("sn"),
+            is_online=device.get("is_online"),
+            properties=_parse_properties(properties),
+            operating_status=self._parse_operating_status(status),
+        )
+
+    def _parse_operating_status(self, data: dict[str, Any]) -> Mower_operating_status:
+        # Datapoint "32" is a string holding a JSON document
+        request = json.loads(data.get("32") or "{}").get("request", {})
+
+        try:
+            state: MowerState | None = MowerState(request.get("mower_main_state"))
+        except ValueError:
+            state = None
+        next_start = request.get("next_start")
+        request_time = request.get("request_time")
+        return Mower_operating_status(
+            battery_status=request.get("battery_status", -1),
+            mower_main_state=state,  # type: ignore[arg-type]
+            next_start=(
+                datetime.fromtimestamp(next_start, tz=self._timezone)
+                if isinstance(next_start, (int, float)) else None
+            ),  # type: ignore[arg-type]
+            request_time=(
+                datetime.fromisoformat(request_time.replace("Z", "+00:00")).astimezone(self._timezone)
+                if request_time else None
+            ),  # type: ignore[arg-type]
+        )
+
+
+def _parse_properties(data: dict[str, Any]) -> Mower_properties:
+    return Mower_properties(
+        is_frost_sensor_on=data.get("is_frost_sensor_on"),
+        is_rain_sensor_on=data.get("is_rain_sensor_on"),
+        geofence_latitude=data.get("geofence_latitude"),
+        geofence_longitude=data.get("geofence_longitude"),
+        device_blade_usage_time=data.get("device_blade_usage_time"),
+        device_type_no=data.get("device_type_no"),
+    )
+
+
+def _expiry(data: dict[str, Any]) -> float:
+    """Return when to treat a freshly issued access token as expired."""
+    lifetime = data.get("expire_in", 3600)
+    return time.time() + lifetime - min(TOKEN_EXPIRY_MARGIN, lifetime / 2)
+
+
+def _error_code(data: Any) -> Any:
+    if isinstance(data, dict) and isinstance(data.get("error"), dict):
+        return data["error"].get("code")
+    return None
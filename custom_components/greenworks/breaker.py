@@ -0,0 +1,84 @@
+"""Failure-aware retry scheduling for GreenWorks cloud calls."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import Enum
+import random
+import time
+from typing import Any
+
+
+class BreakerState(str, Enum):
+    """States of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Exponential backoff with jitter plus an open/half-open circuit breaker.
+
+    Every failure doubles the retry delay, from ``initial_backoff`` up to
+    ``max_backoff``, with equal jitter so accounts that failed together do not
+    retry together. After ``threshold`` consecutive failures the circuit opens
+    and requests are refused without calling the cloud until the delay has
+    passed; the next request is then let through as a single half-open probe
+    whose success closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        initial_backoff: float,
+        max_backoff: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker in the closed state."""
+        self.threshold = threshold
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at = 0.0
+        self.rejected = 0
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go out now, moving an expired open circuit to half-open."""
+        if self.state is BreakerState.OPEN:
+            if self._clock() < self.retry_at:
+                self.rejected += 1
+                return False
+            self.state = BreakerState.HALF_OPEN
+        return True
+
+    def retry_in(self) -> float:
+        """Return the seconds until the next call is allowed."""
+        return max(self.retry_at - self._clock(), 0.0)
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the backoff."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at = 0.0
+
+    def record_failure(self) -> float:
+        """Register a failed call and return the jittered delay before the next attempt."""
+        self.failures += 1
+        delay = min(self.initial_backoff * 2 ** (self.failures - 1), self.max_backoff)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self.retry_at = self._clock() + delay
+        if self.state is BreakerState.HALF_OPEN or self.failures >= self.threshold:
+            self.state = BreakerState.OPEN
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current state for diagnostics."""
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "retry_in": round(self.retry_in(), 1),
+            "rejected": self.rejected,
+        }
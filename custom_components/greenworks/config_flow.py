@@ -5,9 +5,33 @@ import homeassistant.helpers.config_validation as cv
 from typing import Any
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from GreenWorksAPI.GreenWorksAPI import UnauthorizedException, GreenWorksAPI
-from .const import CONF_MOWER_NAME, DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+from GreenWorksAPI.GreenWorksAPI import UnauthorizedException
+from . import async_get_options_entry, async_get_request_limiter, async_store_flow_handoff
+from .api import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
+    GreenWorksClient,
+)
+from .const import (
+    ALL_MOWERS,
+    CONF_BACKFILL_STATISTICS,
+    CONF_CONNECT_TIMEOUT,
+    CONF_MOWER_NAME,
+    CONF_READ_TIMEOUT,
+    CONF_STALE_FAILURES,
+    CONF_STALE_MINUTES,
+    CONF_TOTAL_TIMEOUT,
+    DEFAULT_BACKFILL_STATISTICS,
+    DEFAULT_STALE_FAILURES,
+    DEFAULT_STALE_MINUTES,
+    DOMAIN,
+)
+from .storage import async_get_token_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +48,12 @@ class GreenworksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._email = None
         self._password = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> "GreenworksOptionsFlow":
+        """Return the options flow for this handler."""
+        return GreenworksOptionsFlow()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Invoke when a user initiates a flow via the user interface."""
         errors: dict[str, str] = {}
@@ -42,37 +72,45 @@ class GreenworksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if data is not None:
             data[CONF_EMAIL] = self._email
             data[CONF_PASSWORD] = self._password
+            if data.get(CONF_MOWER_NAME, ALL_MOWERS) == ALL_MOWERS:
+                # Account entry: serves every mower of the account
+                data.pop(CONF_MOWER_NAME, None)
+                return await self.async_create_entry(title=data[CONF_EMAIL], data=data)
             return await self.async_create_entry(title=data[CONF_MOWER_NAME], data=data)
 
         errors = {}
-        try:
-            api = await self.hass.async_add_executor_job(
-                GreenWorksAPI, self._email, self._password, self.hass.config.time_zone
-            )
-        except UnauthorizedException:
-            errors["base"] = "auth_error"
-            return self.async_show_form(
-                step_id="user", data_schema=AUTH_SCHEMA, errors=errors)
-
         if self._email is None or self._password is None:
             errors["base"] = "auth_error"
             return self.async_show_form(step_id="user", data_schema=AUTH_SCHEMA, errors=errors)
-        
+
+        api = GreenWorksClient(
+            async_get_clientsession(self.hass),
+            self._email,
+            self._password,
+            dt_util.get_time_zone(self.hass.config.time_zone) or dt_util.DEFAULT_TIME_ZONE,
+            limiter=async_get_request_limiter(self.hass),
+        )
         try:
-            mowers = await self.hass.async_add_executor_job(api.get_devices)
-        except UnauthorizedException as ex:
+            await api.async_login()
+            mowers = await api.async_get_devices()
+        except UnauthorizedException:
             errors["base"] = "auth_error"
-            _LOGGER.error("Unauthorized error fetching devices", ex, exc_info=True, stack_info=True)
             return self.async_show_form(step_id="user", data_schema=AUTH_SCHEMA, errors=errors)
         except Exception as ex:
             _LOGGER.error("Error fetching devices: %s", ex)
             errors["base"] = "unknown_error"
             return self.async_show_form(step_id="user", data_schema=AUTH_SCHEMA, errors=errors)
 
-        all_mowers = {m.name for m in mowers}
+        # Let the entry setup reuse this login and fetch instead of performing its own
+        if api.login_info is not None:
+            token_store = await async_get_token_store(self.hass)
+            token_store.async_set(self._email, api.login_info)
+        async_store_flow_handoff(self.hass, self._email, api, mowers)
+
+        all_mowers = {ALL_MOWERS: "All mowers", **{m.name: m.name for m in mowers}}
 
         DEVICE_SCHEMA = vol.Schema(
-            {vol.Optional(CONF_MOWER_NAME): vol.In(all_mowers)}
+            {vol.Required(CONF_MOWER_NAME, default=ALL_MOWERS): vol.In(all_mowers)}
         )
 
         return self.async_show_form(step_id="device", data_schema=DEVICE_SCHEMA, errors=errors)
@@ -83,11 +121,62 @@ class GreenworksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_create_entry(self, title: str, data: dict) -> FlowResult:
         """Create an oauth config entry or update existing entry for reauth."""
-        # TODO: This example supports only a single config entry. Consider
-        # any special handling needed for multiple config entries.
-        existing_entry = await self.async_set_unique_id(data[CONF_MOWER_NAME])
+        # Mower entries are unique per mower name, account entries per email
+        existing_entry = await self.async_set_unique_id(data.get(CONF_MOWER_NAME, data[CONF_EMAIL]))
         if existing_entry:
             self.hass.config_entries.async_update_entry(existing_entry, data=data)
+            # Entries of other mowers share the account's client; their update
+            # listener hands it the new password
+            for other in self.hass.config_entries.async_entries(DOMAIN):
+                if (
+                    other.entry_id != existing_entry.entry_id
+                    and other.data.get(CONF_EMAIL) == data[CONF_EMAIL]
+                    and other.data.get(CONF_PASSWORD) != data[CONF_PASSWORD]
+                ):
+                    self.hass.config_entries.async_update_entry(
+                        other, data={**other.data, CONF_PASSWORD: data[CONF_PASSWORD]}
+                    )
             await self.hass.config_entries.async_reload(existing_entry.entry_id)
             return self.async_abort(reason="reauth_successful")
-        return super().async_create_entry(title=title, data=data)
\ No newline at end of file
+        return super().async_create_entry(title=title, data=data)
+
+
+class GreenworksOptionsFlow(config_entries.OptionsFlow):
+    """Greenworks options flow."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        """Manage the cloud timeouts, the stale data grace and statistics backfill."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options_entry = async_get_options_entry(self.hass, self.config_entry.data[CONF_EMAIL])
+        if options_entry is not None and options_entry.entry_id != self.config_entry.entry_id:
+            # Options of other entries would never take effect
+            return self.async_abort(reason="account_options", description_placeholders={"entry": options_entry.title})
+
+        options = self.config_entry.options
+        timeout = vol.All(vol.Coerce(float), vol.Range(min=1, max=300))
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_CONNECT_TIMEOUT, default=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)
+                ): timeout,
+                vol.Required(
+                    CONF_READ_TIMEOUT, default=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)
+                ): timeout,
+                vol.Required(
+                    CONF_TOTAL_TIMEOUT, default=options.get(CONF_TOTAL_TIMEOUT, DEFAULT_TOTAL_TIMEOUT)
+                ): timeout,
+                vol.Required(
+                    CONF_STALE_FAILURES, default=options.get(CONF_STALE_FAILURES, DEFAULT_STALE_FAILURES)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=50)),
+                vol.Required(
+                    CONF_STALE_MINUTES, default=options.get(CONF_STALE_MINUTES, DEFAULT_STALE_MINUTES)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                vol.Required(
+                    CONF_BACKFILL_STATISTICS,
+                    default=options.get(CONF_BACKFILL_STATISTICS, DEFAULT_BACKFILL_STATISTICS),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
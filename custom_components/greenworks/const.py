@@ -1,9 +1,66 @@
 """Constants for the Greenworks integration."""
 
+from datetime import timedelta
 from enum import Enum, IntFlag
 
 DOMAIN = "greenworks"
 CONF_MOWER_NAME = "mower_name"
+# Options: timeouts in seconds for connecting, reading a response, and a
+# whole login or device fetch
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_TOTAL_TIMEOUT = "total_timeout"
+# Options: how many consecutive failed polls, and for how many minutes, the
+# last fetched data is kept instead of marking entities unavailable
+CONF_STALE_FAILURES = "stale_failures"
+CONF_STALE_MINUTES = "stale_minutes"
+DEFAULT_STALE_FAILURES = 3
+DEFAULT_STALE_MINUTES = 15
+# Option: keep statistics samples of the unfinished hour across restarts and
+# import them afterwards
+CONF_BACKFILL_STATISTICS = "backfill_statistics"
+DEFAULT_BACKFILL_STATISTICS = True
+
+# Device step choice creating one entry for every mower of the account
+ALL_MOWERS = "__all_mowers__"
+
+# Keys in hass.data[DOMAIN]
+DATA_ACCOUNTS = "accounts"
+DATA_ACCOUNT_LOCK = "account_lock"
+DATA_TOKEN_STORE = "token_store"
+DATA_SNAPSHOT_STORE = "snapshot_store"
+DATA_SESSION_STORE = "session_store"
+DATA_STATISTICS_STORE = "statistics_store"
+DATA_FLOW_HANDOFF = "flow_handoff"
+DATA_REQUEST_LIMITER = "request_limiter"
+
+# How long entry setup may reuse the config flow's login and device fetch
+FLOW_HANDOFF_TTL = timedelta(minutes=1)
+
+# Refresh access tokens in the background this long before the client would
+# refresh them on demand, so both do not spend the same refresh token. The
+# client's expiry already lies a margin before the cloud expires the token.
+TOKEN_REFRESH_LEAD_TIME = timedelta(seconds=30)
+# Retry delay after a failed background token refresh
+TOKEN_REFRESH_RETRY = timedelta(minutes=5)
+
+# Polling intervals, picked from the most active mower of an account
+UPDATE_INTERVAL_ACTIVE = timedelta(seconds=30)
+UPDATE_INTERVAL_DEFAULT = timedelta(seconds=60)
+UPDATE_INTERVAL_DOCKED = timedelta(minutes=5)
+UPDATE_INTERVAL_OFFLINE = timedelta(minutes=15)
+
+# Retry delays after failed polls, and the consecutive failures that open the
+# circuit breaker of an account
+BACKOFF_INITIAL = timedelta(seconds=60)
+BACKOFF_MAX = timedelta(minutes=30)
+BREAKER_THRESHOLD = 3
+
+# Vendor states (MowerState names) grouped by how quickly they change
+ACTIVE_MOWER_STATES = frozenset(
+    {"MOWING", "LEAVING_CHARGING_STATION", "SEARCHING_FOR_CHARGING_STATION"}
+)
+DOCKED_MOWER_STATES = frozenset({"CHARGING", "PARKED_BY_USER"})
 
 
 class LawnMowerActivity(str, Enum):
@@ -13,6 +70,7 @@ class LawnMowerActivity(str, Enum):
     DOCKED = "docked"
     PAUSED = "paused"
     ERROR = "error"
+    RETURNING = "returning"
 
 
 class LawnMowerEntityFeature(IntFlag):
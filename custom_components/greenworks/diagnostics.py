@@ -0,0 +1,37 @@
+"""Diagnostics support for the GreenWorks integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from . import GreenWorksDataCoordinator, async_get_request_limiter
+from .const import DOMAIN
+
+# Account entries are titled and unique by email address
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GreenWorksDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "account": {
+            "entries": len(coordinator.entry_ids),
+            "mowers": len(coordinator.mower),
+            "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+            "poll_phase": round(coordinator.poll_phase, 3),
+            "last_update_success": coordinator.last_update_success,
+            "skipped_notifications": coordinator.skipped_notifications,
+            "last_success": coordinator.last_success.isoformat() if coordinator.last_success else None,
+            "stale": coordinator.stale,
+            "breaker": coordinator.breaker.as_dict(),
+        },
+        "client": coordinator.api.stats,
+        "requests": async_get_request_limiter(hass).as_dict(),
+    }
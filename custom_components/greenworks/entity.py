@@ -0,0 +1,143 @@
+"""Entity helpers shared by the GreenWorks platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import GreenWorksDataCoordinator
+from .const import CONF_MOWER_NAME, DOMAIN
+from .models import MowerSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GreenWorksEntityDescription(EntityDescription):
+    """Describes a value GreenWorks derives from a mower snapshot."""
+
+    value_fn: Callable[[MowerSnapshot], Any]
+    # Snapshot fields (see MowerSnapshot) whose change triggers a state write
+    watched_fields: frozenset[str]
+    # Whether the entity is unavailable while the mower is offline
+    requires_online: bool = True
+
+
+@callback
+def async_setup_mower_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: Callable[[GreenWorksDataCoordinator, str], Iterable[Entity]],
+) -> None:
+    """Add a platform's entities for the mowers served by a config entry.
+
+    Mower entries get the entities of their one mower. Account entries get
+    entities for every mower of the account that has no entry of its own,
+    adding them as mowers appear and removing them when mowers disappear.
+    """
+    coordinator: GreenWorksDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    mower_name: str | None = entry.data.get(CONF_MOWER_NAME)
+    if mower_name is not None:
+        if coordinator.get_mower(mower_name) is None:
+            _LOGGER.warning("No mower named '%s' found; entities stay unavailable until it is reported.", mower_name)
+        async_add_entities(entity_factory(coordinator, mower_name))
+        return
+
+    entities_by_mower: dict[str, list[Entity]] = {}
+
+    @callback
+    def _async_sync_mowers() -> None:
+        # Mowers with their own config entry are served by that entry; adding or
+        # removing one reloads the account entry
+        claimed = {
+            other.data[CONF_MOWER_NAME]
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.data.get(CONF_EMAIL) == entry.data[CONF_EMAIL] and CONF_MOWER_NAME in other.data
+        }
+        names = coordinator.mowers_by_name.keys() - claimed
+
+        registry = er.async_get(hass)
+        for name in entities_by_mower.keys() - names:
+            # Entities of a mower that got its own entry keep their registry
+            # entries for that entry to adopt; those of a vanished mower go
+            gone = name not in coordinator.mowers_by_name
+            if gone:
+                _LOGGER.debug("Mower '%s' is no longer reported; removing its entities", name)
+            for entity in entities_by_mower.pop(name):
+                if gone and entity.registry_entry is not None:
+                    # Also removes the entity from Home Assistant
+                    registry.async_remove(entity.entity_id)
+                else:
+                    hass.async_create_task(entity.async_remove())
+
+        new_entities: list[Entity] = []
+        for name in names - entities_by_mower.keys():
+            entities_by_mower[name] = list(entity_factory(coordinator, name))
+            new_entities.extend(entities_by_mower[name])
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_sync_mowers()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_mowers))
+
+
+class GreenWorksValueEntity(CoordinatorEntity[GreenWorksDataCoordinator]):
+    """Entity showing a description's value, evaluated by the coordinator."""
+
+    entity_description: GreenWorksEntityDescription
+
+    def __init__(
+        self,
+        coordinator: GreenWorksDataCoordinator,
+        mower_name: str,
+        description: GreenWorksEntityDescription,
+    ) -> None:
+        watched = description.watched_fields
+        if description.requires_online:
+            watched |= {"is_online"}
+        super().__init__(coordinator, context=(mower_name, watched))
+        self.entity_description = description
+        self._mower_name = mower_name
+        self._attr_name = f"{mower_name} {description.name}"
+        mower = self._current_mower
+        uid = (mower and mower.uid) or mower_name
+        self._attr_unique_id = f"{uid}_{description.key}"
+
+    @property
+    def _current_mower(self) -> MowerSnapshot | None:
+        return self.coordinator.get_mower(self._mower_name)
+
+    @property
+    def _value(self) -> Any:
+        return self.coordinator.get_value(self._mower_name, self.entity_description.key)
+
+    @property
+    def available(self) -> bool:
+        mower = self._current_mower
+        if mower is None:
+            return False
+        if self.entity_description.requires_online and not mower.is_online:
+            return False
+        return super().available
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        mower = self._current_mower
+        return {
+            "identifiers": {(DOMAIN, (mower and mower.uid) or self._mower_name)},
+            "manufacturer": "GreenWorks",
+            "model": (mower and mower.model) or "GreenWorks Mower",
+            "name": self._mower_name,
+        }
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import Any
 import logging
 
 try:
     from homeassistant.components import lawn_mower as lm  # type: ignore[reportMissingImports]
-    LawnMowerActivity = lm.LawnMowerActivity  # type: ignore[attr-defined]
     LawnMowerEntity = lm.LawnMowerEntity  # type: ignore[attr-defined]
     LawnMowerEntityFeature = lm.LawnMowerEntityFeature  # type: ignore[attr-defined]
 except Exception:  # pragma: no cover - allows local linting without HA installed
-    from .const import LawnMowerActivity, LawnMowerEntityFeature  # type: ignore
+    from .const import LawnMowerEntityFeature  # type: ignore
 
     class LawnMowerEntity:  # type: ignore
         pass
@@ -19,9 +18,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_MOWER_NAME, DOMAIN
+from .const import DOMAIN
 from . import GreenWorksDataCoordinator
-from GreenWorksAPI.GreenWorksAPI import Mower
+from .entity import async_setup_mower_entities
+from .models import MowerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,26 +29,25 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
-    """Set up GreenWorks lawn mower entity for a config entry."""
-    mower_name: str = cast(str, entry.data.get(CONF_MOWER_NAME, ""))
-    key = "coordinator" + mower_name
+    """Set up GreenWorks lawn mower entities for a config entry."""
+    async_setup_mower_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda coordinator, mower_name: [GreenWorksMowerEntity(coordinator, mower_name)],
+    )
 
-    coordinator: GreenWorksDataCoordinator = hass.data[DOMAIN][key]
 
-    # Find the mower matching the selected name
-    target = next((m for m in coordinator.mower if m.name == mower_name), None)
-    if target is None:
-        _LOGGER.warning("No mower named '%s' found; delaying entity creation until data refresh.", mower_name)
-
-    entity = GreenWorksMowerEntity(coordinator, mower_name)
-    async_add_entities([entity], update_before_add=True)
-
-
-class GreenWorksMowerEntity(CoordinatorEntity, LawnMowerEntity):  # type: ignore[misc]
+class GreenWorksMowerEntity(CoordinatorEntity[GreenWorksDataCoordinator], LawnMowerEntity):  # type: ignore[misc]
     """Representation of a GreenWorks mower."""
 
+    # Mower fields (see GreenWorksDataCoordinator) whose change triggers a state write
+    _watched_fields = frozenset({"is_online", "mower_main_state", "battery_status", "next_start"})
+    # Already recorded by the dedicated battery and next start sensors
+    _unrecorded_attributes = frozenset({"battery_level", "next_start"})
+
     def __init__(self, coordinator: GreenWorksDataCoordinator, mower_name: str) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(mower_name, self._watched_fields))
         self._mower_name = mower_name
         self._attr_name = mower_name
         # unique_id should be stable; fallback to name if we can't resolve id yet
@@ -58,43 +57,28 @@ class GreenWorksMowerEntity(CoordinatorEntity, LawnMowerEntity):  # type: ignore
 
         # Try to set a better unique_id if available from current data
         mower = self._current_mower
-        if mower is not None:
-            uid = getattr(mower, "sn", None) or getattr(mower, "id", None)
-            if uid is not None:
-                self._attr_unique_id = str(uid)
+        if mower is not None and mower.uid is not None:
+            self._attr_unique_id = mower.uid
 
     # Helpers
     @property
-    def _current_mower(self) -> Mower | None:
-        """Return the latest mower object matching this entity."""
-        data = self.coordinator.data or []
-        for m in data:
-            try:
-                if getattr(m, "name", None) == self._mower_name:
-                    return m
-            except Exception:  # pragma: no cover - defensive
-                continue
-        return None
+    def _current_mower(self) -> MowerSnapshot | None:
+        """Return the latest snapshot of the mower matching this entity."""
+        return self.coordinator.get_mower(self._mower_name)
 
     # Entity properties
     @property
     def available(self) -> bool:
         mower = self._current_mower
-        base_available = bool(super().available)
-        mower_online = bool(getattr(mower, "is_online", True)) if mower is not None else False
-        return base_available and mower_online
+        return mower is not None and mower.is_online and super().available
 
     @property
     def device_info(self) -> dict[str, Any]:
         mower = self._current_mower
-        identifiers = {(
-            DOMAIN,
-            str(getattr(mower, "sn", None) or getattr(mower, "id", self._mower_name)),
-        )}
         return {
-            "identifiers": identifiers,
+            "identifiers": {(DOMAIN, (mower and mower.uid) or self._mower_name)},
             "manufacturer": "GreenWorks",
-            "model": getattr(mower, "model", "GreenWorks Mower"),
+            "model": (mower and mower.model) or "GreenWorks Mower",
             "name": self._mower_name,
             # Firmware version not available on Mower dataclass; leave empty
             "sw_version": "",
@@ -103,66 +87,21 @@ class GreenWorksMowerEntity(CoordinatorEntity, LawnMowerEntity):  # type: ignore
     @property
     def activity(self) -> Any | None:
         mower = self._current_mower
-
-        if mower is None:
-            return None
-
-        # Attempt to read state from various likely attributes
-        state = None
-        try:
-            # Common patterns: mower.operating_status.mower_main_state, mower.state, mower.status
-            operating_status = getattr(mower, "operating_status", None)
-            if operating_status is not None:
-                state = getattr(operating_status, "mower_main_state", None)
-            if state is None:
-                state = getattr(mower, "mower_main_state", None)
-            if state is None:
-                state = getattr(mower, "state", None)
-            if state is None:
-                state = getattr(mower, "status", None)
-        except Exception:  # pragma: no cover - defensive
-            state = None
-
-        # Normalize enum-like to string name
-        if state is not None and hasattr(state, "name"):
-            state_name: str = str(getattr(state, "name"))
-        else:
-            state_name = str(state).upper() if state is not None else "UNKNOWN"
-
-        # Map vendor states to HA activities
-        mapping: dict[str, Any] = {
-            "MOWING": LawnMowerActivity.MOWING,
-            "LEAVING_CHARGING_STATION": LawnMowerActivity.MOWING,
-            "CHARGING": LawnMowerActivity.DOCKED,
-            "PARKED_BY_USER": LawnMowerActivity.DOCKED,
-            "SEARCHING_FOR_CHARGING_STATION": LawnMowerActivity.RETURNING, # type: ignore
-            "PAUSED": LawnMowerActivity.PAUSED,
-            "STOP_BUTTON_PRESSED": LawnMowerActivity.ERROR,
-            
-        }
-        return mapping.get(state_name)
+        return mower.activity if mower is not None else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional mower attributes such as battery and schedule."""
+        """Return additional mower attributes such as battery and schedule.
+
+        The per-poll ``request_time`` lives on the diagnostic last update sensor
+        so it does not force a new state row on every poll.
+        """
         mower = self._current_mower
         if mower is None:
             return None
         attrs: dict[str, Any] = {}
-        # Battery level from operating_status
-        try:
-            operating_status = getattr(mower, "operating_status", None)
-            if operating_status is not None:
-                battery = getattr(operating_status, "battery_status", None)
-                if battery is not None:
-                    attrs["battery_level"] = battery
-                next_start = getattr(operating_status, "next_start", None)
-                if next_start is not None:
-                    attrs["next_start"] = getattr(next_start, "isoformat", lambda: str(next_start))()
-                request_time = getattr(operating_status, "request_time", None)
-                if request_time is not None:
-                    attrs["request_time"] = getattr(request_time, "isoformat", lambda: str(request_time))()
-        except Exception:  # pragma: no cover
-            pass
+        if mower.battery_status is not None:
+            attrs["battery_level"] = mower.battery_status
+        if mower.next_start is not None:
+            attrs["next_start"] = mower.next_start.isoformat()
         return attrs
-
@@ -0,0 +1,99 @@
+"""Per-poll mower data in the shape the GreenWorks entities read it."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+try:
+    from homeassistant.components.lawn_mower import LawnMowerActivity  # type: ignore[reportMissingImports]
+except Exception:  # pragma: no cover - allows local linting without HA installed
+    from .const import LawnMowerActivity  # type: ignore
+
+from GreenWorksAPI.Enums import MowerState
+from GreenWorksAPI.GreenWorksAPI import Mower
+
+from .session import MowingStats
+
+# Vendor states (MowerState names) mapped to Home Assistant activities
+_ACTIVITIES: dict[str, Any] = {
+    "MOWING": LawnMowerActivity.MOWING,
+    "LEAVING_CHARGING_STATION": LawnMowerActivity.MOWING,
+    "CHARGING": LawnMowerActivity.DOCKED,
+    "PARKED_BY_USER": LawnMowerActivity.DOCKED,
+    "SEARCHING_FOR_CHARGING_STATION": LawnMowerActivity.RETURNING,
+    "PAUSED": LawnMowerActivity.PAUSED,
+    "STOP_BUTTON_PRESSED": LawnMowerActivity.ERROR,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MowerSnapshot:
+    """Normalized state of one mower, built once per refresh.
+
+    Field names double as the change-tracking keys entities watch (see
+    ``GreenWorksDataCoordinator.async_update_listeners``).
+    """
+
+    name: str
+    sn: str | None
+    id: Any
+    model: str | None
+    # Serial number, or device id for mowers without one
+    uid: str | None
+    is_online: bool
+    mower_main_state: MowerState | None
+    activity: Any | None
+    # Raw value as reported, -1 when unknown
+    battery_status: int | None
+    # Percentage, or None when the raw value is not one
+    battery_level: int | None
+    next_start: datetime | None
+    request_time: datetime | None
+    is_frost_sensor_on: bool | None
+    is_rain_sensor_on: bool | None
+    # Time of the live fetch the mower came from; None for restored data
+    fetched_at: datetime | None
+    session: MowingStats | None
+
+    @classmethod
+    def from_mower(
+        cls, mower: Mower, fetched_at: datetime | None = None, session: MowingStats | None = None
+    ) -> MowerSnapshot:
+        """Flatten a library mower."""
+        status = getattr(mower, "operating_status", None)
+        properties = getattr(mower, "properties", None)
+        state = getattr(status, "mower_main_state", None)
+        battery = getattr(status, "battery_status", None)
+        frost = getattr(properties, "is_frost_sensor_on", None)
+        rain = getattr(properties, "is_rain_sensor_on", None)
+        sn = getattr(mower, "sn", None)
+        device_id = getattr(mower, "id", None)
+        uid = sn or device_id
+        return cls(
+            name=mower.name,
+            sn=str(sn) if sn is not None else None,
+            id=device_id,
+            model=getattr(mower, "model", None),
+            uid=str(uid) if uid is not None else None,
+            is_online=bool(getattr(mower, "is_online", True)),
+            mower_main_state=state,
+            activity=_ACTIVITIES.get(getattr(state, "name", None)),  # type: ignore[arg-type]
+            battery_status=battery,
+            battery_level=_battery_level(battery),
+            next_start=getattr(status, "next_start", None),
+            request_time=getattr(status, "request_time", None),
+            is_frost_sensor_on=bool(frost) if frost is not None else None,
+            is_rain_sensor_on=bool(rain) if rain is not None else None,
+            fetched_at=fetched_at,
+            session=session,
+        )
+
+
+def _battery_level(value: Any) -> int | None:
+    try:
+        level = int(value)
+    except (TypeError, ValueError):
+        return None
+    return level if 0 <= level <= 100 else None
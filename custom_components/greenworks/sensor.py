@@ -2,131 +2,130 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+from dataclasses import dataclass
 import logging
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import GreenWorksDataCoordinator
-from .const import CONF_MOWER_NAME, DOMAIN
+from .const import DOMAIN
+from .entity import GreenWorksEntityDescription, GreenWorksValueEntity, async_setup_mower_entities
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class GreenWorksSensorEntityDescription(SensorEntityDescription, GreenWorksEntityDescription):
+    """Describes a GreenWorks sensor."""
+
+
+SENSORS: tuple[GreenWorksSensorEntityDescription, ...] = (
+    GreenWorksSensorEntityDescription(
+        key="battery",
+        name="Battery",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="%",
+        value_fn=lambda mower: mower.battery_level,
+        watched_fields=frozenset({"battery_status"}),
+    ),
+    GreenWorksSensorEntityDescription(
+        key="next_start",
+        name="Next Start",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda mower: mower.next_start,
+        watched_fields=frozenset({"next_start"}),
+    ),
+    # Time the mower last reported its status; changes on every poll
+    GreenWorksSensorEntityDescription(
+        key="last_update",
+        name="Last Update",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda mower: mower.request_time,
+        watched_fields=frozenset({"request_time"}),
+    ),
+    GreenWorksSensorEntityDescription(
+        key="sessions_today",
+        name="Mowing Sessions Today",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda mower: mower.session and mower.session.sessions_today,
+        watched_fields=frozenset({"session"}),
+        requires_online=False,
+    ),
+    GreenWorksSensorEntityDescription(
+        key="mowing_time_today",
+        name="Mowing Time Today",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda mower: mower.session and mower.session.mowing_minutes_today,
+        watched_fields=frozenset({"session"}),
+        requires_online=False,
+    ),
+    # Rolling sum over the last seven days, today included
+    GreenWorksSensorEntityDescription(
+        key="mowing_time_week",
+        name="Mowing Time Week",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda mower: mower.session and mower.session.mowing_minutes_week,
+        watched_fields=frozenset({"session"}),
+        requires_online=False,
+    ),
+    # Mean length of the recent completed sessions, from leaving to reaching the dock
+    GreenWorksSensorEntityDescription(
+        key="average_session",
+        name="Average Mowing Session",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda mower: mower.session and mower.session.average_session_minutes,
+        watched_fields=frozenset({"session"}),
+        requires_online=False,
+    ),
+    # Time the account was last fetched successfully; shows the age of stale
+    # data and stays meaningful while the mower itself is offline
+    GreenWorksSensorEntityDescription(
+        key="last_successful_poll",
+        name="Last Successful Poll",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda mower: mower.fetched_at,
+        watched_fields=frozenset({"fetched_at"}),
+        requires_online=False,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
     """Set up GreenWorks sensors for a config entry."""
-    mower_name: str = cast(str, entry.data.get(CONF_MOWER_NAME, ""))
-    key = "coordinator" + mower_name
-    coordinator: GreenWorksDataCoordinator = hass.data[DOMAIN][key]
+    coordinator: GreenWorksDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_register_values(SENSORS)
 
-    entities: list[SensorEntity] = []
-    entities.append(GreenWorksBatterySensor(coordinator, mower_name))
-    entities.append(GreenWorksNextStartSensor(coordinator, mower_name))
+    def _create_entities(coordinator: GreenWorksDataCoordinator, mower_name: str) -> list[SensorEntity]:
+        return [GreenWorksSensor(coordinator, mower_name, description) for description in SENSORS]
 
-    async_add_entities(entities, update_before_add=True)
+    async_setup_mower_entities(hass, entry, async_add_entities, _create_entities)
 
 
-class _GreenWorksBaseSensor(CoordinatorEntity[GreenWorksDataCoordinator], SensorEntity):
-    def __init__(self, coordinator: GreenWorksDataCoordinator, mower_name: str) -> None:
-        super().__init__(coordinator)
-        self._mower_name = mower_name
+class GreenWorksSensor(GreenWorksValueEntity, SensorEntity):
+    """Sensor showing one value of a GreenWorks mower."""
 
-    @property
-    def _current_mower(self):
-        data = self.coordinator.data or []
-        for m in data:
-            try:
-                if getattr(m, "name", None) == self._mower_name:
-                    return m
-            except Exception:
-                continue
-        return None
+    entity_description: GreenWorksSensorEntityDescription
 
     @property
-    def available(self) -> bool:
-        mower = self._current_mower
-        base_available = bool(super().available)
-        mower_online = bool(getattr(mower, "is_online", True)) if mower is not None else False
-        return base_available and mower_online
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        mower = self._current_mower
-        identifiers = {(
-            DOMAIN,
-            str(getattr(mower, "sn", None) or getattr(mower, "id", self._mower_name)),
-        )}
-        return {
-            "identifiers": identifiers,
-            "manufacturer": "GreenWorks",
-            "model": getattr(mower, "model", "GreenWorks Mower"),
-            "name": self._mower_name,
-        }
-
-
-class GreenWorksBatterySensor(_GreenWorksBaseSensor):
-    _attr_device_class = SensorDeviceClass.BATTERY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "%"
-
-    def __init__(self, coordinator: GreenWorksDataCoordinator, mower_name: str) -> None:
-        super().__init__(coordinator, mower_name)
-        self._attr_name = f"{mower_name} Battery"
-        # Use SN or id for uniqueness
-        mower = self._current_mower
-        uid = getattr(mower, "sn", None) or getattr(mower, "id", mower_name)
-        self._attr_unique_id = f"{uid}_battery"
-
-    @property
-    def native_value(self) -> int | None:
-        mower = self._current_mower
-        if mower is None:
-            return None
-        operating_status = getattr(mower, "operating_status", None)
-        if operating_status is None:
-            return None
-        val = getattr(operating_status, "battery_status", None)
-        try:
-            if val is None:
-                return None
-            # Normalize "-1" or invalid to None
-            val_int = int(val)
-            if val_int < 0 or val_int > 100:
-                return None
-            return val_int
-        except Exception:
-            return None
-
-
-class GreenWorksNextStartSensor(_GreenWorksBaseSensor):
-    _attr_device_class = SensorDeviceClass.TIMESTAMP
-
-    def __init__(self, coordinator: GreenWorksDataCoordinator, mower_name: str) -> None:
-        super().__init__(coordinator, mower_name)
-        self._attr_name = f"{mower_name} Next Start"
-        mower = self._current_mower
-        uid = getattr(mower, "sn", None) or getattr(mower, "id", mower_name)
-        self._attr_unique_id = f"{uid}_next_start"
-
-    @property
-    def native_value(self):  # datetime | None, but keep flexible for HA versions
-        mower = self._current_mower
-        if mower is None:
-            return None
-        operating_status = getattr(mower, "operating_status", None)
-        if operating_status is None:
-            return None
-        return getattr(operating_status, "next_start", None)
-
-
-        
-
+    def native_value(self):
+        return self._value
@@ -0,0 +1,150 @@
+"""Incremental mowing session statistics for GreenWorks mowers."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from .const import ACTIVE_MOWER_STATES, UPDATE_INTERVAL_OFFLINE
+
+# Completed sessions kept for the average session length
+SESSION_HISTORY = 20
+# Days summed into the rolling weekly mowing time
+STATS_DAYS = 7
+# Longer gaps between polls (e.g. Home Assistant was stopped) are not counted
+# as mowing time
+MAX_POLL_GAP = UPDATE_INTERVAL_OFFLINE
+# A session lasts from leaving the dock until the mower is back in a state
+# outside these, usually charging
+SESSION_STATES = ACTIVE_MOWER_STATES | {"PAUSED"}
+
+
+@dataclass(frozen=True, slots=True)
+class MowingStats:
+    """Session statistics of one mower after a poll."""
+
+    sessions_today: int
+    mowing_minutes_today: float
+    mowing_minutes_week: float
+    average_session_minutes: float | None
+    in_session: bool
+
+
+class MowingSessionTracker:
+    """Follow the states of one mower poll by poll and keep session statistics.
+
+    Every update is O(1): per-day totals and the lengths of recent sessions
+    live in bounded deques with running sums, so nothing is recomputed from
+    history.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        # [day ordinal, mowing minutes, sessions started] for the last STATS_DAYS days
+        self._days: deque[list[Any]] = deque()
+        self._week_minutes = 0.0
+        self._lengths: deque[float] = deque(maxlen=SESSION_HISTORY)
+        self._lengths_total = 0.0
+        self._session_start: datetime | None = None
+        # Poll time the mower was last seen mowing, to count the time until the next poll
+        self._mowing_since: datetime | None = None
+        self._last_update: datetime | None = None
+        # Mowing minutes counted by the latest update
+        self.minutes_added = 0.0
+        self.stats = self._make_stats()
+
+    def update(self, state_name: str | None, now: datetime) -> MowingStats:
+        """Apply the state reported at ``now`` (local time) and return the new statistics."""
+        today = self._roll_days(now.date())
+        if (
+            self._session_start is not None
+            and self._last_update is not None
+            and now - self._last_update > MAX_POLL_GAP
+        ):
+            # Nothing is known about the gap; end the session where it was last seen
+            self._end_session(self._last_update)
+        self._last_update = now
+
+        self.minutes_added = 0.0
+        if self._mowing_since is not None:
+            elapsed = now - self._mowing_since
+            if timedelta(0) < elapsed <= MAX_POLL_GAP:
+                self.minutes_added = elapsed.total_seconds() / 60
+                today[1] += self.minutes_added
+                self._week_minutes += self.minutes_added
+        self._mowing_since = now if state_name == "MOWING" else None
+
+        if state_name in SESSION_STATES:
+            if self._session_start is None:
+                self._session_start = now
+                today[2] += 1
+        elif self._session_start is not None:
+            self._end_session(now)
+
+        self.stats = self._make_stats()
+        return self.stats
+
+    def roll_to(self, day: date) -> MowingStats:
+        """Move on to ``day`` (local date) without a poll, e.g. after a restore.
+
+        The statistics otherwise report the last polled day as today.
+        """
+        self._roll_days(day)
+        self.stats = self._make_stats()
+        return self.stats
+
+    def _end_session(self, end: datetime) -> None:
+        assert self._session_start is not None
+        length = (end - self._session_start).total_seconds() / 60
+        if len(self._lengths) == self._lengths.maxlen:
+            self._lengths_total -= self._lengths[0]
+        self._lengths.append(length)
+        self._lengths_total += length
+        self._session_start = None
+
+    def _roll_days(self, day: date) -> list[Any]:
+        ordinal = day.toordinal()
+        if not self._days or self._days[-1][0] < ordinal:
+            self._days.append([ordinal, 0.0, 0])
+            while self._days[0][0] <= ordinal - STATS_DAYS:
+                self._week_minutes -= self._days.popleft()[1]
+        return self._days[-1]
+
+    def _make_stats(self) -> MowingStats:
+        today = self._days[-1] if self._days else (0, 0.0, 0)
+        return MowingStats(
+            sessions_today=today[2],
+            mowing_minutes_today=round(today[1], 1),
+            mowing_minutes_week=round(max(self._week_minutes, 0.0), 1),
+            average_session_minutes=round(self._lengths_total / len(self._lengths), 1) if self._lengths else None,
+            in_session=self._session_start is not None,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tracker state for storage."""
+        return {
+            "days": list(self._days),
+            "lengths": list(self._lengths),
+            "session_start": self._session_start.isoformat() if self._session_start else None,
+            "mowing_since": self._mowing_since.isoformat() if self._mowing_since else None,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MowingSessionTracker:
+        """Restore a tracker stored with ``as_dict``."""
+        tracker = cls()
+        tracker._days = deque([int(ordinal), float(minutes), int(sessions)] for ordinal, minutes, sessions in data["days"])
+        tracker._week_minutes = sum(day[1] for day in tracker._days)
+        tracker._lengths.extend(float(length) for length in data["lengths"])
+        tracker._lengths_total = sum(tracker._lengths)
+        if data.get("session_start"):
+            tracker._session_start = datetime.fromisoformat(data["session_start"])
+        if data.get("mowing_since"):
+            tracker._mowing_since = datetime.fromisoformat(data["mowing_since"])
+        if data.get("last_update"):
+            tracker._last_update = datetime.fromisoformat(data["last_update"])
+        tracker.stats = tracker._make_stats()
+        return tracker
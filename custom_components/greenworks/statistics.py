@@ -0,0 +1,172 @@
+"""Hourly long-term statistics imported for GreenWorks mowers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # pragma: no cover - Home Assistant before 2025.4
+    StatisticMeanType = None  # type: ignore[assignment,misc]
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Metadata keys differ between Home Assistant releases
+_METADATA_KEYS = frozenset(getattr(StatisticMetaData, "__annotations__", {}))
+# Complete hours (of all mowers of an account) waiting for import; older ones
+# are dropped while the recorder cannot take them
+MAX_PENDING_HOURS = 24 * 14
+
+
+@dataclass(slots=True)
+class _HourBucket:
+    """Samples of one mower within one hour."""
+
+    start: datetime
+    name: str
+    mowing_minutes: float = 0.0
+
+
+class HourlyStatistics:
+    """Aggregate per-poll samples of an account's mowers into hourly statistics.
+
+    Mowing time becomes an hourly sum, imported with
+    ``async_add_external_statistics`` once an hour is complete instead of
+    being compiled from every recorded state. The battery sensor has a state
+    class, so the recorder already compiles its statistics. The buckets of the
+    hour in progress can be persisted so samples from before a restart or an
+    outage are still imported afterwards.
+    """
+
+    def __init__(self, hass: HomeAssistant, pending: dict[str, Any] | None = None) -> None:
+        """Initialize the aggregator, resuming buckets persisted by ``as_dict``."""
+        self.hass = hass
+        # Open bucket per mower uid, and complete buckets waiting for import
+        self._buckets: dict[str, _HourBucket] = {}
+        self._ready: deque[tuple[str, _HourBucket]] = deque(maxlen=MAX_PENDING_HOURS)
+        # Last imported cumulative mowing time per statistic id
+        self._sums: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+        for uid, data in (pending or {}).get("open", {}).items():
+            self._buckets[uid] = _bucket_from_dict(data)
+        for uid, data in (pending or {}).get("ready", []):
+            self._ready.append((uid, _bucket_from_dict(data)))
+
+    @callback
+    def add(self, uid: str, name: str, mowing_minutes: float, at: datetime) -> bool:
+        """Add the samples of one poll; return whether an hour became complete."""
+        if "recorder" not in self.hass.config.components:
+            # Nothing could ever import them
+            self._buckets.clear()
+            self._ready.clear()
+            return False
+        hour = dt_util.as_utc(at).replace(minute=0, second=0, microsecond=0)
+        bucket = self._buckets.get(uid)
+        completed = False
+        if bucket is not None and bucket.start != hour:
+            self._ready.append((uid, bucket))
+            bucket = None
+            completed = True
+        if bucket is None:
+            bucket = self._buckets[uid] = _HourBucket(hour, name)
+        bucket.mowing_minutes += mowing_minutes
+        return completed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the buckets not imported yet, for storage."""
+        return {
+            "open": {uid: _bucket_to_dict(bucket) for uid, bucket in self._buckets.items()},
+            "ready": [[uid, _bucket_to_dict(bucket)] for uid, bucket in self._ready],
+        }
+
+    async def async_import(self) -> None:
+        """Import every complete hour into the recorder."""
+        if "recorder" not in self.hass.config.components:
+            return
+        async with self._lock:
+            ready, self._ready = self._ready, deque(maxlen=MAX_PENDING_HOURS)
+            by_mower: dict[str, list[_HourBucket]] = {}
+            for uid, bucket in ready:
+                by_mower.setdefault(uid, []).append(bucket)
+            for uid, buckets in by_mower.items():
+                buckets.sort(key=lambda bucket: bucket.start)
+                try:
+                    await self._async_import_mower(uid, buckets)
+                except Exception:  # statistics must never break polling
+                    _LOGGER.exception("Could not import GreenWorks statistics for %s", buckets[0].name)
+
+    async def _async_import_mower(self, uid: str, buckets: list[_HourBucket]) -> None:
+        name = buckets[-1].name
+        mowing_id = f"{DOMAIN}:mowing_time_{slugify(uid)}"
+        total, last_start = await self._async_last_sum(mowing_id)
+        mowing = []
+        for bucket in buckets:
+            if last_start is not None and bucket.start <= last_start:
+                # Already imported before a restart
+                continue
+            total += bucket.mowing_minutes
+            mowing.append(StatisticData(start=bucket.start, state=bucket.mowing_minutes, sum=total))
+        if mowing:
+            self._sums[mowing_id] = total
+            async_add_external_statistics(
+                self.hass, _metadata(mowing_id, f"{name} Mowing Time", UnitOfTime.MINUTES), mowing
+            )
+
+    async def _async_last_sum(self, statistic_id: str) -> tuple[float, datetime | None]:
+        """Return the last imported sum, and its hour when it comes from the database."""
+        if statistic_id in self._sums:
+            return self._sums[statistic_id], None
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+        )
+        rows = last.get(statistic_id)
+        if not rows:
+            return 0.0, None
+        start = rows[0]["start"]
+        if not isinstance(start, datetime):
+            start = dt_util.utc_from_timestamp(start)
+        return rows[0].get("sum") or 0.0, start
+
+
+def _metadata(statistic_id: str, name: str, unit: str) -> StatisticMetaData:
+    metadata: dict[str, Any] = {
+        "has_sum": True,
+        "name": name,
+        "source": DOMAIN,
+        "statistic_id": statistic_id,
+        "unit_of_measurement": unit,
+    }
+    if "mean_type" in _METADATA_KEYS and StatisticMeanType is not None:
+        metadata["mean_type"] = StatisticMeanType.NONE
+    if "has_mean" in _METADATA_KEYS:
+        metadata["has_mean"] = False
+    if "unit_class" in _METADATA_KEYS:
+        metadata["unit_class"] = None
+    return StatisticMetaData(**metadata)  # type: ignore[typeddict-item]
+
+
+def _bucket_to_dict(bucket: _HourBucket) -> dict[str, Any]:
+    data = asdict(bucket)
+    data["start"] = bucket.start.isoformat()
+    return data
+
+
+def _bucket_from_dict(data: dict[str, Any]) -> _HourBucket:
+    return _HourBucket(**{**data, "start": datetime.fromisoformat(data["start"])})
@@ -0,0 +1,232 @@
+"""Persistent storage for the GreenWorks integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime
+import logging
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from GreenWorksAPI.Enums import MowerState
+from GreenWorksAPI.GreenWorksAPI import Mower
+from GreenWorksAPI.Records import Login_object, Mower_operating_status, Mower_properties
+
+from .const import (
+    DATA_SESSION_STORE,
+    DATA_SNAPSHOT_STORE,
+    DATA_STATISTICS_STORE,
+    DATA_TOKEN_STORE,
+    DOMAIN,
+)
+from .session import MowingSessionTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+TOKEN_STORAGE_KEY = f"{DOMAIN}.auth"
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+SESSION_STORAGE_KEY = f"{DOMAIN}.sessions"
+STATISTICS_STORAGE_KEY = f"{DOMAIN}.statistics"
+# Coalesce token writes from several accounts into one disk write
+TOKEN_SAVE_DELAY = 5
+# Stores written on every poll. async_delay_save restarts its timer with each
+# write, so the delay must stay below the fastest poll interval (30 s) or the
+# data would only ever be written on shutdown
+SNAPSHOT_SAVE_DELAY = 10
+SESSION_SAVE_DELAY = 10
+STATISTICS_SAVE_DELAY = 10
+
+_StoreT = TypeVar("_StoreT", bound="_GreenWorksAccountStore")
+
+
+class _GreenWorksAccountStore:
+    """Per-account JSON data kept in a single Home Assistant store."""
+
+    key: str
+    save_delay: float
+    private = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, self.key, private=self.private
+        )
+        self._accounts: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Read stored data from disk."""
+        self._accounts = await self._store.async_load() or {}
+
+    @callback
+    def async_remove(self, email: str) -> None:
+        """Forget the data of an account."""
+        if self._accounts.pop(email, None) is not None:
+            self._store.async_delay_save(self._data_to_save, self.save_delay)
+
+    @callback
+    def _async_set_raw(self, email: str, data: Any) -> None:
+        self._accounts[email] = data
+        self._store.async_delay_save(self._data_to_save, self.save_delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return self._accounts
+
+
+class GreenWorksTokenStore(_GreenWorksAccountStore):
+    """Keep the cloud tokens of every account across Home Assistant restarts."""
+
+    key = TOKEN_STORAGE_KEY
+    save_delay = TOKEN_SAVE_DELAY
+    private = True
+
+    def get(self, email: str) -> Login_object | None:
+        """Return the stored login info of an account, if any."""
+        data = self._accounts.get(email)
+        if data is None:
+            return None
+        try:
+            return Login_object(**data)
+        except TypeError:
+            _LOGGER.debug("Ignoring malformed stored tokens for %s", email)
+            return None
+
+    @callback
+    def async_set(self, email: str, login_info: Login_object) -> None:
+        """Remember the login info of an account."""
+        self._async_set_raw(email, asdict(login_info))
+
+
+class GreenWorksSnapshotStore(_GreenWorksAccountStore):
+    """Keep the last successful device fetch of every account across restarts."""
+
+    key = SNAPSHOT_STORAGE_KEY
+    save_delay = SNAPSHOT_SAVE_DELAY
+
+    def get(self, email: str) -> list[Mower] | None:
+        """Return the last stored mowers of an account, if any."""
+        data = self._accounts.get(email)
+        if not data:
+            return None
+        try:
+            return [_mower_from_dict(item) for item in data]
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring malformed stored snapshot for %s", email)
+            return None
+
+    @callback
+    def async_set(self, email: str, mowers: list[Mower]) -> None:
+        """Remember the mowers of an account."""
+        self._async_set_raw(email, [_mower_to_dict(mower) for mower in mowers])
+
+
+class GreenWorksSessionStore(_GreenWorksAccountStore):
+    """Keep the mowing session statistics of every account across restarts."""
+
+    key = SESSION_STORAGE_KEY
+    save_delay = SESSION_SAVE_DELAY
+
+    def get(self, email: str) -> dict[str, MowingSessionTracker]:
+        """Return the stored session trackers of an account by mower name."""
+        trackers: dict[str, MowingSessionTracker] = {}
+        for name, data in (self._accounts.get(email) or {}).items():
+            try:
+                trackers[name] = MowingSessionTracker.from_dict(data)
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.debug("Ignoring malformed stored sessions of %s", name)
+        return trackers
+
+    @callback
+    def async_set(self, email: str, trackers: dict[str, MowingSessionTracker]) -> None:
+        """Remember the session trackers of an account."""
+        self._async_set_raw(email, {name: tracker.as_dict() for name, tracker in trackers.items()})
+
+
+class GreenWorksStatisticsStore(_GreenWorksAccountStore):
+    """Keep the statistics samples not imported yet, to backfill them after a restart."""
+
+    key = STATISTICS_STORAGE_KEY
+    save_delay = STATISTICS_SAVE_DELAY
+
+    def get(self, email: str) -> dict[str, Any] | None:
+        """Return the pending statistics buckets of an account, if any."""
+        return self._accounts.get(email)
+
+    @callback
+    def async_set(self, email: str, pending: dict[str, Any]) -> None:
+        """Remember the pending statistics buckets of an account."""
+        self._async_set_raw(email, pending)
+
+
+def _mower_to_dict(mower: Mower) -> dict[str, Any]:
+    status = mower.operating_status
+    state = status.mower_main_state
+    return {
+        "id": mower.id,
+        "name": mower.name,
+        "sn": mower.sn,
+        "is_online": mower.is_online,
+        "model": mower.model,
+        "properties": asdict(mower.properties),
+        "status": {
+            "battery_status": status.battery_status,
+            "mower_main_state": state.value if state is not None else None,
+            "next_start": status.next_start.isoformat() if status.next_start else None,
+            "request_time": status.request_time.isoformat() if status.request_time else None,
+        },
+    }
+
+
+def _mower_from_dict(data: dict[str, Any]) -> Mower:
+    status = data["status"]
+    state = status.get("mower_main_state")
+    next_start = status.get("next_start")
+    request_time = status.get("request_time")
+    return Mower(
+        id=data["id"],
+        name=data["name"],
+        sn=data["sn"],
+        is_online=data["is_online"],
+        model=data["model"],
+        properties=Mower_properties(**data["properties"]),
+        operating_status=Mower_operating_status(
+            battery_status=status.get("battery_status", -1),
+            mower_main_state=MowerState(state) if state is not None else None,  # type: ignore[arg-type]
+            next_start=datetime.fromisoformat(next_start) if next_start else None,  # type: ignore[arg-type]
+            request_time=datetime.fromisoformat(request_time) if request_time else None,  # type: ignore[arg-type]
+        ),
+    )
+
+
+async def _async_get_store(hass: HomeAssistant, data_key: str, store_cls: type[_StoreT]) -> _StoreT:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store: _StoreT | None = domain_data.get(data_key)
+    if store is None:
+        store = store_cls(hass)
+        await store.async_load()
+        # Another caller may have finished loading while we were waiting
+        store = domain_data.setdefault(data_key, store)
+    return store
+
+
+async def async_get_token_store(hass: HomeAssistant) -> GreenWorksTokenStore:
+    """Return the integration-wide token store, loading it on first use."""
+    return await _async_get_store(hass, DATA_TOKEN_STORE, GreenWorksTokenStore)
+
+
+async def async_get_snapshot_store(hass: HomeAssistant) -> GreenWorksSnapshotStore:
+    """Return the integration-wide snapshot store, loading it on first use."""
+    return await _async_get_store(hass, DATA_SNAPSHOT_STORE, GreenWorksSnapshotStore)
+
+
+async def async_get_session_store(hass: HomeAssistant) -> GreenWorksSessionStore:
+    """Return the integration-wide session store, loading it on first use."""
+    return await _async_get_store(hass, DATA_SESSION_STORE, GreenWorksSessionStore)
+
+
+async def async_get_statistics_store(hass: HomeAssistant) -> GreenWorksStatisticsStore:
+    """Return the integration-wide statistics store, loading it on first use."""
+    return await _async_get_store(hass, DATA_STATISTICS_STORE, GreenWorksStatisticsStore)
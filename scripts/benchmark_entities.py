@@ -0,0 +1,211 @@
+"""Benchmark entity property evaluation over synthetic fleets.
+
+Every coordinator update converts the fetched mowers into snapshots and
+evaluates the registered entity descriptions once (``refresh``, timed by
+seeding a real coordinator with the fleet), then Home Assistant evaluates the
+state properties of each entity (``available``, ``activity``,
+``native_value``, ``is_on``, ``extra_state_attributes``). This script builds
+synthetic fleets of 1 to 1,000 mowers, creates the integration's entities for
+them and times one full pass per fleet size.
+
+Requires Home Assistant and the GreenWorks library to be installed::
+
+    python scripts/benchmark_entities.py --save       # store a baseline
+    python scripts/benchmark_entities.py              # compare against it
+
+Comparing exits with status 1 when any measurement is slower than the
+baseline by more than ``--threshold`` (20 % by default).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from functools import partial
+import json
+from pathlib import Path
+import random
+import sys
+import timeit
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from GreenWorksAPI.Enums import MowerState  # noqa: E402
+from GreenWorksAPI.GreenWorksAPI import Mower  # noqa: E402
+from GreenWorksAPI.Records import Mower_operating_status, Mower_properties  # noqa: E402
+
+from custom_components.greenworks import GreenWorksDataCoordinator  # noqa: E402
+from custom_components.greenworks.binary_sensor import (  # noqa: E402
+    BINARY_SENSORS,
+    GreenWorksBinarySensor,
+)
+from custom_components.greenworks.lawn_mower import GreenWorksMowerEntity  # noqa: E402
+from custom_components.greenworks.sensor import SENSORS, GreenWorksSensor  # noqa: E402
+
+DEFAULT_BASELINE = ROOT / "scripts" / ".entity_benchmark_baseline.json"
+FLEET_SIZES = (1, 10, 100, 1000)
+
+
+def _sensor(coordinator: Any, mower_name: str, description: Any) -> GreenWorksSensor:
+    return GreenWorksSensor(coordinator, mower_name, description)
+
+
+def _binary_sensor(coordinator: Any, mower_name: str, description: Any) -> GreenWorksBinarySensor:
+    return GreenWorksBinarySensor(coordinator, mower_name, description)
+
+
+# Entity factories and the properties Home Assistant reads when writing their state
+ENTITY_TYPES: dict[str, tuple[Callable[[Any, str], Any], tuple[str, ...]]] = {
+    "lawn_mower": (GreenWorksMowerEntity, ("available", "activity", "extra_state_attributes")),
+    **{
+        f"sensor.{d.key}": (partial(_sensor, description=d), ("available", "native_value"))
+        for d in SENSORS
+    },
+    **{
+        f"binary_sensor.{d.key}": (partial(_binary_sensor, description=d), ("available", "is_on"))
+        for d in BINARY_SENSORS
+    },
+}
+
+
+class _DiscardingStore:
+    """Account store that starts empty and drops writes; the benchmark measures CPU, not disk."""
+
+    def __init__(self, empty: Callable[[], Any] = lambda: None) -> None:
+        self._empty = empty
+
+    def get(self, email: str) -> Any:
+        return self._empty()
+
+    def async_set(self, email: str, data: Any) -> None:
+        pass
+
+    def async_remove(self, email: str) -> None:
+        pass
+
+
+class _OfflineClient:
+    """Client stand-in; a seeded coordinator never talks to the cloud."""
+
+    login_info = None
+    on_login_changed = None
+
+
+def build_coordinator(hass: HomeAssistant, mowers: list[Mower]) -> GreenWorksDataCoordinator:
+    """Return a coordinator serving ``mowers`` with every description registered."""
+    store = _DiscardingStore()
+    coordinator = GreenWorksDataCoordinator(
+        hass, _OfflineClient(), "bench@example.com", store, store, _DiscardingStore(dict), store  # type: ignore[arg-type]
+    )
+    coordinator.set_backfill_statistics(False)
+    coordinator.async_register_values((*SENSORS, *BINARY_SENSORS))
+    coordinator.async_seed_data(mowers)
+    return coordinator
+
+
+def build_fleet(size: int, seed: int = 0) -> list[Mower]:
+    """Return ``size`` mowers in a realistic mix of states."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    states = list(MowerState)
+    return [
+        Mower(
+            id=index,
+            name=f"Mower {index}",
+            sn=f"SN{index:08d}",
+            is_online=rng.random() > 0.05,
+            properties=Mower_properties(
+                is_frost_sensor_on=rng.random() < 0.1,
+                is_rain_sensor_on=rng.random() < 0.2,
+                geofence_latitude=55.0,
+                geofence_longitude=12.0,
+                device_blade_usage_time=rng.randrange(10_000),
+                device_type_no="BENCH",
+            ),
+            operating_status=Mower_operating_status(
+                battery_status=rng.choice((-1, rng.randrange(101))),
+                mower_main_state=rng.choice(states),
+                next_start=now + timedelta(hours=rng.randrange(48)),
+                request_time=now,
+            ),
+        )
+        for index in range(size)
+    ]
+
+
+def measure(hass: HomeAssistant, size: int, repeat: int) -> dict[str, float]:
+    """Return the best per-update time in microseconds for each entity type."""
+    mowers = build_fleet(size)
+    coordinator = build_coordinator(hass, mowers)
+    number = max(1, 2000 // size)
+    fetched_at = datetime.now(timezone.utc)
+    best = min(
+        timeit.repeat(lambda: coordinator.async_seed_data(mowers, fetched_at), number=number, repeat=repeat)
+    ) / number * 1e6
+    results: dict[str, float] = {"refresh": best}
+    total = best
+    for name, (factory, properties) in ENTITY_TYPES.items():
+        entities = [factory(coordinator, mower.name) for mower in mowers]
+        getters = [getattr(type(entities[0]), prop).fget for prop in properties]
+
+        def _update(entities: list[Any] = entities, getters: list[Any] = getters) -> None:
+            for entity in entities:
+                for getter in getters:
+                    getter(entity)
+
+        best = min(timeit.repeat(_update, number=number, repeat=repeat)) / number * 1e6
+        results[name] = best
+        total += best
+    results["total"] = total
+    return results
+
+
+async def _async_measure_all(sizes: list[int], repeat: int) -> dict[str, dict[str, float]]:
+    # Coordinators need a Home Assistant instance, but it is never started
+    hass = HomeAssistant(str(ROOT))
+    return {str(size): measure(hass, size, repeat) for size in sizes}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown ratio")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(FLEET_SIZES))
+    args = parser.parse_args()
+
+    results = asyncio.run(_async_measure_all(args.sizes, args.repeat))
+    baseline: dict[str, dict[str, float]] = {}
+    if not args.save and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    regressions = []
+    print(f"{'fleet':>6} {'entity':<28} {'us/update':>12} {'us/mower':>10} {'baseline':>12}")
+    for size, timings in results.items():
+        for name, value in timings.items():
+            reference = baseline.get(size, {}).get(name)
+            change = ""
+            if reference:
+                ratio = value / reference - 1
+                change = f"{ratio:+.0%}"
+                if ratio > args.threshold:
+                    regressions.append(f"{name} @ {size} mowers: {change}")
+            print(f"{size:>6} {name:<28} {value:>12.1f} {value / int(size):>10.2f} {change:>12}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        print("Regressions over threshold:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+"""Local stand-in for the GreenWorks cloud, for offline load and latency testing.
+
+Emulates the login, token refresh, device list, property and status
+endpoints used by the integration's ``GreenWorksClient`` with a synthetic
+fleet of mowers, configurable per-endpoint latency, error rates and token
+expiry.
+
+Serve it and point the integration at it::
+
+    python scripts/simulator.py serve --mowers 200 --latency devices=0.3:0.1
+    GREENWORKS_API_BASE_URL=http://127.0.0.1:8765/v2/ hass -c config
+
+or drive the client against it in-process and report setup time and poll
+throughput::
+
+    python scripts/simulator.py bench --accounts 20 --mowers 50 --polls 10
+
+Any email/password pair logs in unless it is listed with ``--reject``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+import random
+import secrets
+import statistics
+import time
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+TOKEN_REJECTED_CODE = 4031022
+ENDPOINTS = ("login", "refresh", "user", "devices", "property", "status")
+# Vendor MowerState values cycled through by simulated mowers, with dwell times in seconds
+STATE_CYCLE = (
+    (5, 60),  # LEAVING_CHARGING_STATION
+    (4, 1800),  # MOWING
+    (6, 120),  # SEARCHING_FOR_CHARGING_STATION
+    (7, 3600),  # CHARGING
+    (2, 7200),  # PARKED_BY_USER
+)
+
+
+@dataclass
+class Latency:
+    """Normally distributed latency in seconds, clipped at zero."""
+
+    mean: float = 0.0
+    stddev: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        return max(0.0, rng.gauss(self.mean, self.stddev)) if self.stddev else self.mean
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour of the simulated cloud."""
+
+    mowers: int = 1
+    offline_ratio: float = 0.0
+    token_ttl: float = 3600.0
+    latency: dict[str, Latency] = field(default_factory=dict)
+    error_rate: dict[str, float] = field(default_factory=dict)
+    rejected_emails: set[str] = field(default_factory=set)
+    seed: int = 0
+
+
+@dataclass
+class _Token:
+    user_id: int
+    expires: float
+
+
+class GreenWorksSimulator:
+    """aiohttp application emulating the GreenWorks cloud."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._started = time.monotonic()
+        self._access_tokens: dict[str, _Token] = {}
+        self._refresh_tokens: dict[str, int] = {}
+        self._emails: dict[int, str] = {}
+        self.request_counts: dict[str, int] = dict.fromkeys(ENDPOINTS, 0)
+        self.error_counts: dict[str, int] = dict.fromkeys(ENDPOINTS, 0)
+
+    def create_app(self) -> web.Application:
+        """Return the application with all emulated routes."""
+        app = web.Application()
+        app.add_routes(
+            [
+                web.post("/v2/user_auth", self._login),
+                web.post("/v2/user/token/refresh", self._refresh),
+                web.get("/v2/user/{user_id}/subscribe/devices", self._devices),
+                web.get("/v2/user/{user_id}", self._user),
+                web.get("/v2/product/{product_id}/device/{device_id}/property", self._property),
+                web.get("/v2/product/{product_id}/v_device/{device_id}", self._status),
+            ]
+        )
+        return app
+
+    async def _simulate(self, endpoint: str) -> web.Response | None:
+        """Apply latency and injected errors; return an error response if one was drawn."""
+        self.request_counts[endpoint] += 1
+        latency = self.config.latency.get(endpoint)
+        if latency is not None:
+            await asyncio.sleep(latency.sample(self._rng))
+        if self._rng.random() < self.config.error_rate.get(endpoint, 0.0):
+            self.error_counts[endpoint] += 1
+            return web.json_response({"error": {"code": 5000000, "msg": "simulated failure"}}, status=500)
+        return None
+
+    def _authorize(self, request: web.Request) -> tuple[int | None, web.Response | None]:
+        token = self._access_tokens.get(request.headers.get("Access-Token", ""))
+        if token is None or token.expires < time.time():
+            return None, web.json_response(
+                {"error": {"code": TOKEN_REJECTED_CODE, "msg": "token invalid"}}, status=403
+            )
+        return token.user_id, None
+
+    def _issue_tokens(self, user_id: int) -> dict[str, Any]:
+        access_token = secrets.token_hex(16)
+        refresh_token = secrets.token_hex(16)
+        self._access_tokens[access_token] = _Token(user_id, time.time() + self.config.token_ttl)
+        self._refresh_tokens[refresh_token] = user_id
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "expire_in": int(self.config.token_ttl),
+        }
+
+    async def _login(self, request: web.Request) -> web.Response:
+        if (error := await self._simulate("login")) is not None:
+            return error
+        body = await request.json()
+        email = body.get("email", "")
+        if email in self.config.rejected_emails:
+            return web.json_response({"error": {"code": 4001007, "msg": "password error"}}, status=400)
+        user_id = int(hashlib.sha1(email.encode()).hexdigest()[:8], 16)
+        self._emails[user_id] = email
+        return web.json_response({"user_id": user_id, "authorize": "", **self._issue_tokens(user_id)})
+
+    async def _refresh(self, request: web.Request) -> web.Response:
+        if (error := await self._simulate("refresh")) is not None:
+            return error
+        body = await request.json()
+        user_id = self._refresh_tokens.pop(body.get("refresh_token", ""), None)
+        if user_id is None:
+            return web.json_response({"error": {"code": 4031021, "msg": "refresh token invalid"}}, status=403)
+        return web.json_response(self._issue_tokens(user_id))
+
+    async def _user(self, request: web.Request) -> web.Response:
+        if (error := await self._simulate("user")) is not None:
+            return error
+        user_id, denied = self._authorize(request)
+        if denied is not None:
+            return denied
+        return web.json_response({"id": user_id, "email": self._emails.get(user_id, ""), "nickname": "sim"})
+
+    async def _devices(self, request: web.Request) -> web.Response:
+        if (error := await self._simulate("devices")) is not None:
+            return error
+        user_id, denied = self._authorize(request)
+        if denied is not None:
+            return denied
+        devices = []
+        for index in range(self.config.mowers):
+            device_id = user_id * 10_000 + index
+            devices.append(
+                {
+                    "id": device_id,
+                    "product_id": 1000,
+                    "name": f"Mower {index + 1}",
+                    "sn": f"SIM{device_id:012d}",
+                    "is_online": self._device_rng(device_id).random() >= self.config.offline_ratio,
+                }
+            )
+        return web.json_response({"list": devices})
+
+    async def _property(self, request: web.Request) -> web.Response:
+        if (error := await self._simulate("property")) is not None:
+            return error
+        _, denied = self._authorize(request)
+        if denied is not None:
+            return denied
+        rng = self._device_rng(int(request.match_info["device_id"]))
+        return web.json_response(
+            {
+                "is_frost_sensor_on": rng.random() < 0.1,
+                "is_rain_sensor_on": rng.random() < 0.2,
+                "geofence_latitude": 55.0 + rng.random(),
+                "geofence_longitude": 12.0 + rng.random(),
+                "device_blade_usage_time": rng.randrange(10_000),
+                "device_type_no": "SIM",
+            }
+        )
+
+    async def _status(self, request: web.Request) -> web.Response:
+        if (error := await self._simulate("status")) is not None:
+            return error
+        _, denied = self._authorize(request)
+        if denied is not None:
+            return denied
+        device_id = int(request.match_info["device_id"])
+        state, battery, next_start = self._mower_state(device_id)
+        payload = {
+            "request": {
+                "battery_status": battery,
+                "mower_main_state": state,
+                "next_start": int(next_start.timestamp()),
+                "request_time": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            }
+        }
+        return web.json_response({"32": json.dumps(payload)})
+
+    def _device_rng(self, device_id: int) -> random.Random:
+        """Stable per-device randomness, so a mower keeps its traits between requests."""
+        return random.Random(self.config.seed * 1_000_003 + device_id)
+
+    def _mower_state(self, device_id: int) -> tuple[int, int, datetime]:
+        """Walk the mower through STATE_CYCLE from a per-device phase."""
+        cycle = sum(dwell for _, dwell in STATE_CYCLE)
+        position = (time.monotonic() - self._started + self._device_rng(device_id).randrange(cycle)) % cycle
+        elapsed = position
+        for state, dwell in STATE_CYCLE:
+            if elapsed < dwell:
+                break
+            elapsed -= dwell
+        if state == 4:
+            battery = max(5, 100 - int(elapsed / 20))
+        elif state == 7:
+            battery = min(100, 10 + int(elapsed / 36))
+        else:
+            battery = 100 if state == 2 else 40
+        # The next cycle starts by leaving the charging station again
+        return state, battery, datetime.now(timezone.utc) + timedelta(seconds=cycle - position)
+
+
+def _load_client_module() -> Any:
+    """Import the integration's api.py without importing Home Assistant."""
+    path = Path(__file__).resolve().parents[1] / "custom_components" / "greenworks" / "api.py"
+    spec = importlib.util.spec_from_file_location("greenworks_api", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _async_bench(config: SimulatorConfig, accounts: int, polls: int, host: str, port: int) -> None:
+    api = _load_client_module()
+    simulator = GreenWorksSimulator(config)
+    runner = web.AppRunner(simulator.create_app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    base_url = f"http://{host}:{port}/v2/"
+
+    try:
+        # Share one limiter between accounts, as the integration does
+        limiter = api.RequestLimiter()
+        async with aiohttp.ClientSession() as session:
+            clients = [
+                api.GreenWorksClient(session, f"user{index}@example.com", "secret", timezone.utc, base_url, limiter)
+                for index in range(accounts)
+            ]
+
+            started = time.perf_counter()
+            await asyncio.gather(*(client.async_login() for client in clients))
+            login_time = time.perf_counter() - started
+
+            poll_times: list[float] = []
+            failures = 0
+            mowers_seen = 0
+
+            async def _poll(client: Any) -> None:
+                nonlocal failures, mowers_seen
+                poll_started = time.perf_counter()
+                try:
+                    mowers = await client.async_get_devices()
+                    mowers_seen += len(mowers)
+                except Exception:  # noqa: BLE001 - count every failed poll
+                    failures += 1
+                poll_times.append(time.perf_counter() - poll_started)
+
+            started = time.perf_counter()
+            for _ in range(polls):
+                await asyncio.gather(*(_poll(client) for client in clients))
+            poll_wall = time.perf_counter() - started
+    finally:
+        await runner.cleanup()
+
+    total_polls = accounts * polls
+    print(f"accounts={accounts} mowers/account={config.mowers} polls/account={polls}")
+    print(f"login: {login_time * 1000:.0f} ms for {accounts} accounts")
+    print(
+        f"polls: {total_polls} in {poll_wall:.2f} s ({total_polls / poll_wall:.1f} polls/s, "
+        f"{mowers_seen / poll_wall:.0f} mowers/s), failures={failures}"
+    )
+    print(
+        f"poll latency: mean={statistics.fmean(poll_times) * 1000:.0f} ms "
+        f"p50={_percentile(poll_times, 0.5) * 1000:.0f} ms "
+        f"p95={_percentile(poll_times, 0.95) * 1000:.0f} ms "
+        f"max={max(poll_times) * 1000:.0f} ms"
+    )
+    print("requests: " + ", ".join(f"{name}={count}" for name, count in simulator.request_counts.items()))
+    print("limiter: " + ", ".join(f"{name}={value}" for name, value in limiter.as_dict().items()))
+    print("injected errors: " + ", ".join(f"{name}={count}" for name, count in simulator.error_counts.items()))
+
+
+def _parse_pairs(values: list[str], convert: Any) -> dict[str, Any]:
+    pairs: dict[str, Any] = {}
+    for value in values:
+        endpoint, _, setting = value.partition("=")
+        if endpoint not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint '{endpoint}', expected one of {', '.join(ENDPOINTS)}")
+        pairs[endpoint] = convert(setting)
+    return pairs
+
+
+def _parse_latency(value: str) -> Latency:
+    mean, _, stddev = value.partition(":")
+    return Latency(float(mean), float(stddev or 0))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=("serve", "bench"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--mowers", type=int, default=1, help="mowers per account")
+    parser.add_argument("--offline-ratio", type=float, default=0.0, help="share of mowers reported offline")
+    parser.add_argument("--token-ttl", type=float, default=3600.0, help="access token lifetime in seconds")
+    parser.add_argument(
+        "--latency", action="append", default=[], metavar="ENDPOINT=MEAN[:STDDEV]",
+        help=f"response delay in seconds; endpoints: {', '.join(ENDPOINTS)}",
+    )
+    parser.add_argument(
+        "--error-rate", action="append", default=[], metavar="ENDPOINT=RATE",
+        help="share of requests answered with HTTP 500",
+    )
+    parser.add_argument("--reject", action="append", default=[], metavar="EMAIL", help="refuse logins for this email")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--accounts", type=int, default=1, help="bench: concurrent accounts")
+    parser.add_argument("--polls", type=int, default=5, help="bench: polls per account")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        mowers=args.mowers,
+        offline_ratio=args.offline_ratio,
+        token_ttl=args.token_ttl,
+        latency=_parse_pairs(args.latency, _parse_latency),
+        error_rate=_parse_pairs(args.error_rate, float),
+        rejected_emails=set(args.reject),
+        seed=args.seed,
+    )
+    if args.mode == "serve":
+        web.run_app(GreenWorksSimulator(config).create_app(), host=args.host, port=args.port)
+    else:
+        asyncio.run(_async_bench(config, args.accounts, args.polls, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()